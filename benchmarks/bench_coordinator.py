@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Setup latency, refresh latency, entity update cost and memory per refresh against the local mock API.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_coordinator
+"""
+
+import asyncio
+import gc
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from aiohttp import ClientSession
+from homeassistant.core import HomeAssistant
+
+from custom_components.pollen_lu import MyCoordinator
+from custom_components.pollen_lu.fetcher import SharedFetcher
+from custom_components.pollen_lu.history import PollenHistory
+from custom_components.pollen_lu.models import parse_pollens, project_translations
+from custom_components.pollen_lu.sensor import PollenSensor
+
+from .mock_api import MockPollenApi
+from .payloads import make_pollens, make_translations
+
+REFRESHES = 20
+
+
+class Harness:
+    """A coordinator, its sensors and the pollen history, fetching from the mock API."""
+
+    def __init__(self, hass, session, api, entry_id="bench"):
+        self.fetcher = SharedFetcher(session, min_age=0, parsers={"pollens": parse_pollens, "translations": project_translations}, base_url=f"{api.url}/api")
+        self.history = PollenHistory(hass)
+        self.fetcher.async_add_listener("pollens", self.history.async_handle_pollens)
+        entry = SimpleNamespace(entry_id=entry_id, options={}, data={})
+        self.coordinator = MyCoordinator(hass, entry, self.fetcher)
+        self.coordinator.history = self.history
+        self.fetcher.async_add_listener("pollens", self.coordinator.async_handle_pollens)
+        self.sensors = []
+        self._remove_listeners = []
+
+    def add_sensors(self, hass):
+        """Create a sensor per pollen, writing to the state machine like a platform would."""
+        for record in self.coordinator.pollen_by_key.values():
+            sensor = PollenSensor(self.coordinator, record)
+            sensor.hass = hass
+            sensor.async_write_ha_state = lambda sensor=sensor: hass.states.async_set(
+                sensor.entity_id, sensor.state, sensor.extra_state_attributes
+            )
+            self._remove_listeners.append(self.coordinator.async_add_listener(sensor._handle_coordinator_update))
+            self.sensors.append(sensor)
+
+    def close(self):
+        for remove_listener in self._remove_listeners:
+            remove_listener()
+
+
+def new_payload(api, count, refresh):
+    """Serve a changed /pollens payload with a new measurement date."""
+    hour = refresh % 24
+    day = 1 + refresh // 24
+    api.set_payload("pollens", make_pollens(count, seed=refresh, measurement_date=f"2024-07-{day:02d} {hour:02d}:00:12"))
+
+
+async def bench(hass, session, count, extra):
+    pollens = make_pollens(count)
+    api = MockPollenApi(pollens, make_translations(pollens, extra))
+    await api.start()
+    try:
+        # Cold setup: translations and pollens fetched from the API
+        start = time.perf_counter()
+        harness = Harness(hass, session, api)
+        await harness.coordinator.async_refresh()
+        await harness.coordinator.async_wait_ready()
+        cold_setup = time.perf_counter() - start
+        harness.add_sensors(hass)
+
+        # Setup from the persisted cache, revalidated later
+        await harness.coordinator._store.async_save(harness.coordinator._cache_data())
+        start = time.perf_counter()
+        cached = Harness(hass, session, api)
+        await cached.coordinator.async_load_cache()
+        await cached.coordinator.async_wait_ready()
+        cached_setup = time.perf_counter() - start
+
+        # Unchanged refresh, answered with 304 Not Modified
+        start = time.perf_counter()
+        for _ in range(REFRESHES):
+            await harness.coordinator.async_refresh()
+        unchanged = (time.perf_counter() - start) / REFRESHES
+
+        # Changed refresh, parsing the payload and updating every sensor
+        changed = updates = 0.0
+        for refresh in range(REFRESHES):
+            new_payload(api, count, refresh)
+            start = time.perf_counter()
+            await harness.coordinator.async_refresh()
+            changed += time.perf_counter() - start
+            # Entity update cost alone: every sensor renders and writes its state
+            harness.coordinator.changed_keys = set(harness.coordinator.pollen_by_key)
+            start = time.perf_counter()
+            harness.coordinator.async_update_listeners()
+            updates += time.perf_counter() - start
+
+        # Memory allocated and retained per changed refresh, traced separately to keep the timings clean
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        for refresh in range(REFRESHES, 2 * REFRESHES):
+            new_payload(api, count, refresh)
+            await harness.coordinator.async_refresh()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+        harness.close()
+        return {
+            "cold_setup": cold_setup,
+            "cached_setup": cached_setup,
+            "unchanged": unchanged,
+            "changed": changed / REFRESHES,
+            "update": updates / REFRESHES / max(1, len(harness.sensors)),
+            "peak": peak,
+            "retained": retained / REFRESHES,
+        }
+    finally:
+        await api.stop()
+
+
+async def async_main():
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config.language = "de"
+        async with ClientSession() as session:
+            print(
+                f"{'pollens':>8} {'cold setup ms':>14} {'cached setup ms':>16} {'304 refresh ms':>15} "
+                f"{'changed refresh ms':>19} {'update us/entity':>17} {'peak KiB':>9} {'KiB/refresh':>12}"
+            )
+            for count, extra in ((12, 100), (100, 1000), (500, 5000)):
+                result = await bench(hass, session, count, extra)
+                print(
+                    f"{count:>8} {result['cold_setup'] * 1000:>14.2f} {result['cached_setup'] * 1000:>16.2f} "
+                    f"{result['unchanged'] * 1000:>15.2f} {result['changed'] * 1000:>19.2f} "
+                    f"{result['update'] * 1e6:>17.1f} {result['peak'] / 1024:>9.0f} {result['retained'] / 1024:>12.1f}"
+                )
+        await hass.async_stop(force=True)
+
+
+def main():
+    asyncio.run(async_main())
+
+
+if __name__ == "__main__":
+    main()
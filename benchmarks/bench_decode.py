@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Decode time and retained memory of /pollens and /translations payloads.
+
+Compares the json module with orjson, and keeping the decoded payload with
+keeping only what the sensors use (parsed pollen records and projected
+translations). The synthetic payloads carry the fields of the live API the
+sensors never read, such as further pictures and descriptions and other
+translation domains. Peaks show the transient memory of decoding. Run from
+the repository root with Home Assistant and orjson installed:
+
+    python -m benchmarks.bench_decode
+"""
+
+import gc
+import json
+import timeit
+import tracemalloc
+
+import orjson
+
+from custom_components.pollen_lu.models import parse_pollens, project_translations
+
+from .payloads import LOCALES, make_pollens, make_translations
+
+
+def make_full_pollens(count):
+    """Return a /pollens payload with the fields of the live API the sensors do not use."""
+    pollens = make_pollens(count)
+    for pollen in pollens:
+        key = pollen["translationKey"]
+        pollen["latinName"] = f"{key.title()} latinus"
+        pollen["color"] = "#7cb342"
+        pollen["createdAt"] = pollen["updatedAt"] = "2024-03-01T08:00:00.000Z"
+        pollen["descriptions"] += [f"{key}_description_{i}" for i in range(1, 4)]
+        pollen["pictures"] += [
+            {"path": f"https://pollen-api.chl.lu/pictures/{key}_{i}.jpg", "width": 1024, "height": 768, "copyright": "LIH"}
+            for i in range(1, 4)
+        ]
+    return pollens
+
+
+def make_full_translations(pollens, extra):
+    """Return a /translations payload with metadata and keys of other domains."""
+    translations = make_translations(pollens) + [
+        {**item, "domain": "app"} for item in make_translations([], extra)
+    ]
+    for number, item in enumerate(translations):
+        item["id"] = number
+        for translation in item["translations"]:
+            translation["createdAt"] = translation["updatedAt"] = "2024-03-01T08:00:00.000Z"
+    return translations
+
+
+def allocated(build):
+    """Return the KiB still allocated by the result of build(), and the peak while building it."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size / 1024, peak / 1024
+
+
+def measure(name, body, project):
+    number = max(1, 20000000 // len(body))
+    decode_json = min(timeit.repeat(lambda: json.loads(body)["data"], number=number, repeat=3)) / number
+    decode_orjson = min(timeit.repeat(lambda: orjson.loads(body)["data"], number=number, repeat=3)) / number
+    projected = min(timeit.repeat(lambda: project(orjson.loads(body)["data"]), number=number, repeat=3)) / number
+    full, peak_json = allocated(lambda: json.loads(body)["data"])
+    kept, peak_orjson = allocated(lambda: project(orjson.loads(body)["data"]))
+    print(
+        f"{name:<18} {len(body) / 1024:>8.0f} {decode_json * 1000:>8.2f} {decode_orjson * 1000:>10.2f} "
+        f"{projected * 1000:>12.2f} {full:>10.0f} {kept:>9.0f} {peak_json:>10.0f} {peak_orjson:>12.0f}"
+    )
+
+
+def main():
+    print(f"{'payload':<18} {'body KiB':>8} {'json ms':>8} {'orjson ms':>10} {'+project ms':>12} {'full KiB':>10} {'kept KiB':>9} {'json peak':>10} {'orjson peak':>12}")
+    for count in (12, 200, 2000):
+        pollens = make_full_pollens(count)
+        translations = make_full_translations(pollens, count * 10)
+        measure(f"pollens {count}", json.dumps({"data": pollens}).encode(), parse_pollens)
+        measure(f"translations {count}", json.dumps({"data": translations}).encode(), project_translations)
+    print(f"({len(LOCALES)} locales per translation key, other domains ten times the pollen count)")
+    print("orjson allocates a parse buffer of several times the body while decoding, freed right after")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Cold-start and per-refresh cost of the environmental data extraction.
+
+Run from the repository root with Home Assistant and pyproj installed:
+
+    python -m benchmarks.bench_environment
+"""
+
+import subprocess
+import sys
+import timeit
+
+from custom_components.pollen_lu.environment import (
+    ETRS89,
+    WGS84,
+    GmlStationParser,
+    GridLocator,
+    StationLocator,
+    get_location,
+    get_transformer,
+    locate_all,
+)
+
+from .payloads import make_gml, make_grid
+
+HOME = (49.6602, 5.9173)
+
+
+def cold_start():
+    """Time importing pyproj and projecting the home location in a fresh interpreter."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        "from custom_components.pollen_lu.environment import get_location; "
+        f"get_location({HOME[0]}, {HOME[1]}); "
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(output.stdout)
+
+
+def parse_gml(document, locators, chunk_size=64 * 1024):
+    parser = GmlStationParser(locators)
+    for start in range(0, len(document), chunk_size):
+        parser.feed(document[start:start + chunk_size])
+        if parser.done:
+            break
+    return parser.close()
+
+
+def main():
+    print(f"cold start (pyproj import + projection): {cold_start() * 1000:.1f} ms")
+
+    from pyproj import Transformer
+
+    number = 50
+    uncached = timeit.timeit(lambda: Transformer.from_crs(ETRS89, WGS84, always_xy=True), number=number) / number
+    cached = timeit.timeit(lambda: get_transformer(ETRS89, WGS84), number=number) / number
+    print(f"transformer per refresh: built {uncached * 1000:.3f} ms, cached {cached * 1000:.4f} ms")
+
+    location = get_location(*HOME)
+    for size in (100, 300, 600):
+        payload = make_grid(size)
+        locator = GridLocator(location.o3.x, location.o3.y)
+        first = timeit.timeit(lambda: GridLocator(locator.x, locator.y).locate(payload["grid"]), number=1)
+        locator.locate(payload["grid"])
+        again = timeit.timeit(lambda: locator.locate(payload["grid"]), number=1000) / 1000
+        print(f"grid {size * size:>7} cells: scan {first * 1000:.2f} ms, cached {again * 1e6:.2f} us")
+
+    for stations in (100, 1000):
+        document = make_gml(stations)
+        station = location.station
+        first = timeit.timeit(lambda: parse_gml(document, [StationLocator(station.x, station.y)]), number=1)
+        locator = StationLocator(station.x, station.y)
+        parse_gml(document, [locator])
+        again = min(timeit.repeat(lambda: parse_gml(document, [locator]), number=1, repeat=5))
+        print(f"gml {stations:>5} stations ({len(document) // 1024} KiB): search {first * 1000:.1f} ms, known station {again * 1000:.1f} ms")
+
+    # Several locations: one pass over each download versus one pass per location
+    payload = make_grid(300)
+    document = make_gml(1000)
+    for count in (1, 3, 10):
+        locations = [
+            (location.o3.x + i * 1500, location.o3.y - i * 1500, location.station.x + i * 1500, location.station.y - i * 1500)
+            for i in range(count)
+        ]
+        separate = min(timeit.repeat(lambda: [
+            (GridLocator(x, y).locate(payload["grid"]), parse_gml(document, [StationLocator(sx, sy)]))
+            for x, y, sx, sy in locations
+        ], number=1, repeat=3))
+        batched = min(timeit.repeat(lambda: (
+            locate_all(payload["grid"], [GridLocator(x, y) for x, y, _, _ in locations]),
+            parse_gml(document, [StationLocator(sx, sy) for _, _, sx, sy in locations]),
+        ), number=1, repeat=3))
+        print(f"{count:>2} locations, first search: per location {separate * 1000:.1f} ms, batched {batched * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
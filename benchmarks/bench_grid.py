@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Nearest grid cell search: Python loop versus vectorized NumPy path.
+
+Run from the repository root with Home Assistant and NumPy installed:
+
+    python -m benchmarks.bench_grid
+"""
+
+import random
+import timeit
+
+from custom_components.pollen_lu.environment import nearest_cells_numpy, nearest_cells_python
+
+from .payloads import make_grid
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'cells':>8} {'k':>3} {'python ms':>10} {'numpy ms':>9} {'speedup':>8}")
+    for size in (50, 100, 300, 600):
+        grid = make_grid(size)["grid"]
+        for k in (1, 4):
+            x = 50000 + rng.uniform(0, size * 1000)
+            y = 55000 + rng.uniform(0, size * 1000)
+            expected = nearest_cells_python(grid, x, y, k)
+            actual = nearest_cells_numpy(grid, x, y, k)
+            assert [index for _, index in actual] == [index for _, index in expected], (expected, actual)
+            number = max(1, 200000 // len(grid))
+            python = min(timeit.repeat(lambda: nearest_cells_python(grid, x, y, k), number=number, repeat=3)) / number
+            vectorized = min(timeit.repeat(lambda: nearest_cells_numpy(grid, x, y, k), number=number, repeat=3)) / number
+            print(f"{len(grid):>8} {k:>3} {python * 1000:>10.2f} {vectorized * 1000:>9.2f} {python / vectorized:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
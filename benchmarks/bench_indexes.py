@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Per-refresh cost of parsed, indexed pollen records versus linear scans of the raw payload.
+
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.bench_indexes
+"""
+
+import asyncio
+import timeit
+from types import SimpleNamespace
+
+from custom_components.pollen_lu import MyCoordinator
+from custom_components.pollen_lu.models import parse_pollens
+from custom_components.pollen_lu.sensor import PollenSensor
+from custom_components.pollen_lu.translator import Translator
+
+from .payloads import make_pollens, make_translations
+
+RENDERS_PER_REFRESH = 3
+
+
+def make_coordinator(pollens, translations):
+    coordinator = MyCoordinator.__new__(MyCoordinator)
+    coordinator.pollen = parse_pollens(pollens)
+    coordinator.pollen_by_key = {}
+    coordinator.translations = translations
+    coordinator.last_poll = None
+    coordinator.next_poll = None
+    coordinator._ready = asyncio.Event()
+    coordinator.changed_keys = set()
+    coordinator.history = None
+    coordinator.stale = False
+    coordinator._build_pollen_index()
+    coordinator.translator = Translator("de")
+    coordinator._load_translations()
+    return coordinator
+
+
+def make_sensors(coordinator, language="de"):
+    hass = SimpleNamespace(config=SimpleNamespace(language=language))
+    sensors = []
+    for record in coordinator.pollen:
+        sensor = PollenSensor(coordinator, record)
+        sensor.hass = hass
+        sensors.append(sensor)
+    return sensors
+
+
+def render(sensors):
+    for sensor in sensors:
+        sensor.name
+        sensor.state
+        sensor.extra_state_attributes
+
+
+def linear_render(pollens, translations, sensors, language="de"):
+    """Reference implementation of the former next(...) scans over the raw payload."""
+    def translate(key, domain):
+        item = next((item for item in translations if item["key"] == key and item["domain"] == domain), None)
+        if item:
+            translation = next((t for t in item["translations"] if t["locale"] == language), None)
+            if translation:
+                return translation["content"]
+        return key
+
+    for sensor in sensors:
+        translate(sensor.entity_type, "pollen")
+        pollen = next(item for item in pollens if item["translationKey"] == sensor.entity_type and item["active"])
+        pollen["level"]
+        pollen = next(item for item in pollens if item["translationKey"] == sensor.entity_type and item["active"])
+        translate(pollen["descriptions"][0], "pollen")
+        next(item for item in pollen["threshold"] if item["type"] == "medium")
+        next(item for item in pollen["threshold"] if item["type"] == "high")
+
+
+def refresh_indexed(coordinator, pollens, sensors):
+    coordinator.pollen = parse_pollens(pollens)
+    coordinator._build_pollen_index()
+    for _ in range(RENDERS_PER_REFRESH):
+        render(sensors)
+
+
+def refresh_linear(pollens, translations, sensors):
+    for _ in range(RENDERS_PER_REFRESH):
+        linear_render(pollens, translations, sensors)
+
+
+def main():
+    print(f"{'pollens':>8} {'translations':>13} {'linear ms':>10} {'indexed ms':>11} {'speedup':>8}")
+    for count, extra in ((12, 100), (100, 1000), (500, 5000)):
+        pollens = make_pollens(count)
+        translations = make_translations(pollens, extra)
+        coordinator = make_coordinator(pollens, translations)
+        sensors = make_sensors(coordinator)
+        number = max(1, 2000 // count)
+        linear = min(timeit.repeat(lambda: refresh_linear(pollens, translations, sensors), number=number, repeat=3)) / number
+        indexed = min(timeit.repeat(lambda: refresh_indexed(coordinator, pollens, sensors), number=number, repeat=3)) / number
+        print(f"{count:>8} {len(translations):>13} {linear * 1000:>10.3f} {indexed * 1000:>11.3f} {linear / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
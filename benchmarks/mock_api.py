@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Local stand-in for the pollen.lu API, replaying recorded or synthetic payloads.
+
+Serves /api/pollens and /api/translations with ETag / Last-Modified
+validators, answering conditional requests with 304 Not Modified, and can
+add latency and random server errors. /geocode/search and /geocode/reverse
+answer like geoportail.lu with locations derived from the query, and no
+result for the zip code 0000. Run from the repository root:
+
+    python -m benchmarks.mock_api --pollens 500 --latency 0.2 --error-rate 0.1
+
+or replay recorded responses of the live API:
+
+    python -m benchmarks.mock_api --pollens-file pollens.json --translations-file translations.json
+
+Point a SharedFetcher at it with base_url=f"{api.url}/api" and a Geocoder
+with base_url=f"{api.url}/geocode".
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+from email.utils import formatdate
+
+from aiohttp import web
+
+from .payloads import make_pollens, make_translations
+
+
+def load_payload(path):
+    """Load a recorded response, either the full {"data": ...} body or only its data."""
+    with open(path, encoding="utf-8") as file:
+        payload = json.load(file)
+    return payload["data"] if isinstance(payload, dict) and "data" in payload else payload
+
+
+class MockPollenApi:
+    """aiohttp server answering like the pollen.lu API."""
+
+    def __init__(self, pollens=None, translations=None, latency=0.0, error_rate=0.0, conditional=True, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.conditional = conditional
+        self.url = None
+        self.stats = {"requests": 0, "not_modified": 0, "errors": 0, "geocode": 0}
+        self._rng = random.Random(seed)
+        self._bodies = {}
+        self._runner = None
+        pollens = pollens if pollens is not None else make_pollens(12)
+        self.set_payload("pollens", pollens)
+        self.set_payload("translations", translations if translations is not None else make_translations(pollens))
+
+    def set_payload(self, endpoint, data) -> None:
+        """Replace the data served by an endpoint, changing its validators."""
+        body = json.dumps({"data": data}).encode()
+        self._bodies[endpoint] = (body, f'"{hashlib.sha256(body).hexdigest()[:16]}"', formatdate(usegmt=True))
+
+    async def _handle(self, request):
+        endpoint = request.match_info["endpoint"]
+        self.stats["requests"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if endpoint not in self._bodies:
+            raise web.HTTPNotFound()
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.stats["errors"] += 1
+            raise web.HTTPServiceUnavailable()
+        body, etag, last_modified = self._bodies[endpoint]
+        if self.conditional:
+            headers = {"ETag": etag, "Last-Modified": last_modified}
+            if request.headers.get("If-None-Match") == etag or (
+                "If-None-Match" not in request.headers and request.headers.get("If-Modified-Since") == last_modified
+            ):
+                self.stats["not_modified"] += 1
+                return web.Response(status=304, headers=headers)
+        else:
+            headers = {}
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def _handle_search(self, request):
+        self.stats["geocode"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        query = "|".join(f"{key}={value}" for key, value in sorted(request.query.items()))
+        if request.query.get("zip") == "0000":
+            return web.json_response({"results": []})
+        digest = hashlib.sha256(query.encode()).digest()
+        longitude = 5.75 + digest[0] / 255 * 0.7
+        latitude = 49.45 + digest[1] / 255 * 0.4
+        return web.json_response({"results": [{"name": query, "geomlonlat": {"type": "Point", "coordinates": [longitude, latitude]}}]})
+
+    async def _handle_reverse(self, request):
+        self.stats["geocode"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        latitude = float(request.query["lat"])
+        longitude = float(request.query["lon"])
+        number = int(latitude * 1000) % 100 + 1
+        return web.json_response({"results": [{"name": f"{number}", "address": f"{number} Rue {longitude:.3f}, L-{int(latitude * 100) % 10000:04d} Luxembourg", "distance": 1.0}]})
+
+    async def start(self, host="127.0.0.1", port=0) -> str:
+        """Start serving, returning the base URL."""
+        app = web.Application()
+        app.router.add_get("/api/{endpoint}", self._handle)
+        app.router.add_get("/geocode/search", self._handle_search)
+        app.router.add_get("/geocode/reverse", self._handle_reverse)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def serve(args):
+    pollens = load_payload(args.pollens_file) if args.pollens_file else make_pollens(args.pollens)
+    translations = load_payload(args.translations_file) if args.translations_file else make_translations(pollens, args.extra_translations)
+    api = MockPollenApi(pollens, translations, args.latency, args.error_rate, not args.no_conditional)
+    url = await api.start(args.host, args.port)
+    print(f"Serving {len(pollens)} pollens and {len(translations)} translations at {url}/api")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await api.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--pollens", type=int, default=12, help="number of synthetic pollen types")
+    parser.add_argument("--extra-translations", type=int, default=0, help="unrelated synthetic translation keys")
+    parser.add_argument("--pollens-file", help="recorded /pollens response to replay")
+    parser.add_argument("--translations-file", help="recorded /translations response to replay")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--no-conditional", action="store_true", help="never send validators or 304 responses")
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
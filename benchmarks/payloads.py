@@ -0,0 +1,101 @@
+"""Synthetic pollen.lu API payloads for benchmarks."""
+
+import random
+
+LOCALES = ["en", "de", "fr", "lb"]
+LEVELS = ["undetected", "low", "medium", "high"]
+
+
+def make_pollens(count, seed=0, measurement_date="2024-07-03 12:00:12"):
+    """Return a list of `count` pollen records shaped like the /pollens payload."""
+    rng = random.Random(seed)
+    pollens = []
+    for i in range(count):
+        key = f"pollen_{i}"
+        pollens.append({
+            "id": i,
+            "translationKey": key,
+            "active": True,
+            "level": rng.choice(LEVELS),
+            "value": rng.uniform(0, 200),
+            "lastMeasurementDate": measurement_date,
+            "descriptions": [f"{key}_description"],
+            "pictures": [{"path": f"https://pollen-api.chl.lu/pictures/{key}.svg"}],
+            "threshold": [
+                {"type": "low", "min": 1},
+                {"type": "medium", "min": 11},
+                {"type": "high", "min": 51},
+            ],
+        })
+    return pollens
+
+
+def make_translations(pollens, extra=0):
+    """Return a /translations payload covering `pollens` plus `extra` unrelated keys."""
+    keys = []
+    for pollen in pollens:
+        keys.append(pollen["translationKey"])
+        keys.extend(pollen["descriptions"])
+    keys.extend(f"unrelated_{i}" for i in range(extra))
+    return [
+        {
+            "domain": "pollen",
+            "key": key,
+            "translations": [
+                {"locale": locale, "content": f"{key} ({locale})"}
+                for locale in LOCALES
+            ],
+        }
+        for key in keys
+    ]
+
+
+def make_grid(size, step=1000, seed=0):
+    """Return an O3/NO2 style payload with a size x size grid of LUREF cells."""
+    rng = random.Random(seed)
+    grid = [
+        {"gc_id": f"X-{50000 + x * step}:Y-{55000 + y * step}", "value": rng.uniform(0, 120), "index": rng.randint(1, 6)}
+        for x in range(size)
+        for y in range(size)
+    ]
+    return {"date": "03.07.2024", "hour": "12", "grid": grid}
+
+
+def make_gml(stations, rows=24, seed=0):
+    """Return a weather GML document (bytes) with `stations` observation feature members."""
+    rng = random.Random(seed)
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<gml:FeatureCollection xmlns:gml="http://www.opengis.net/gml/3.2" '
+        'xmlns:omso="http://inspire.ec.europa.eu/schemas/omso/3.0" '
+        'xmlns:swe="http://www.opengis.net/swe/1.0/gml32">'
+    ]
+    fields = [
+        ("Date", None),
+        ("Hour", None),
+        ("Average Air Temperature 200cm above ground", "Â°C"),
+        ("Relative Air Humidity 200cm above ground", "%"),
+        ("Maximum Air Temperature 200cm above ground", "Â°C"),
+        ("Minimum Air Temperature 200cm above ground", "Â°C"),
+        ("Precipitation (incl. snow and hail)", "mm"),
+    ]
+    field_xml = "".join(
+        f'<swe:field><swe:name name="{name}"/>' + (f'<swe:uom code="{code}"/>' if code else "") + "</swe:field>"
+        for name, code in fields
+    )
+    for i in range(stations):
+        northing = 2900000 + rng.uniform(0, 150000)
+        easting = 4000000 + rng.uniform(0, 150000)
+        values = "\n".join(
+            f"03.07.2024;{hour:02d}:00;{rng.uniform(5, 30):.1f};{rng.uniform(30, 90):.0f};"
+            f"{rng.uniform(15, 30):.1f};{rng.uniform(5, 15):.1f};{rng.uniform(0, 5):.1f}"
+            for hour in range(rows)
+        )
+        parts.append(
+            f"<gml:featureMember><omso:PointTimeSeriesObservation>"
+            f"<gml:Point><gml:pos>{northing:.2f} {easting:.2f} {rng.uniform(150, 550):.0f}</gml:pos></gml:Point>"
+            f"<swe:DataArray>{field_xml}<swe:values>{values}</swe:values></swe:DataArray>"
+            f"</omso:PointTimeSeriesObservation></gml:featureMember>"
+        )
+    parts.append("</gml:FeatureCollection>")
+    return "".join(parts).encode()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Replay /pollens payloads through MyCoordinator and the pollen sensors, reporting their event loop time.
+
+The payloads are served by an in-process session instead of the network, so
+a replay only measures the integration: hashing, decoding and parsing, the
+history, and rendering and writing the changed sensors, as recorded by the
+coordinator in profiling mode. The sequence is replayed --repeat times from
+a fresh coordinator and the fastest time of each payload is reported, with
+garbage collection paused, so reports are reproducible on an idle machine.
+Run from the repository root with Home Assistant installed:
+
+    python -m benchmarks.replay pollens-1.json pollens-2.json --translations translations.json
+    python -m benchmarks.replay --synthetic 48 --pollens 100 --json report.json
+
+Payloads can be recorded from the live API, one file per update:
+
+    curl -o pollens-$(date +%s).json https://pollen-api.chl.lu/api/pollens
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import tempfile
+import time
+from types import SimpleNamespace
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.pollen_lu import MyCoordinator
+from custom_components.pollen_lu.const import CONF_PROFILING
+from custom_components.pollen_lu.fetcher import SharedFetcher
+from custom_components.pollen_lu.history import PollenHistory
+from custom_components.pollen_lu.models import parse_pollens, project_translations
+from custom_components.pollen_lu.sensor import PollenSensor
+
+from .mock_api import load_payload
+from .payloads import make_pollens, make_translations
+
+
+class ReplayResponse:
+    """A 200 response with a fixed body, as much of aiohttp's response as the fetcher uses."""
+
+    status = 200
+    headers = {}
+
+    def __init__(self, body):
+        self.body = body
+        self.content_length = len(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class ReplaySession:
+    """Answer the fetcher with the current body of each endpoint, without any I/O."""
+
+    def __init__(self, translations):
+        self.bodies = {"translations": json.dumps({"data": translations}).encode()}
+
+    def set_payload(self, endpoint, data) -> None:
+        self.bodies[endpoint] = json.dumps({"data": data}).encode()
+
+    def get(self, url, **kwargs):
+        return ReplayResponse(self.bodies[url.rsplit("/", 1)[-1]])
+
+
+class Replay:
+    """A coordinator in profiling mode with its history and sensors, fed by a ReplaySession."""
+
+    def __init__(self, hass, translations):
+        self.hass = hass
+        self.session = ReplaySession(translations)
+        self.fetcher = SharedFetcher(self.session, min_age=0, parsers={"pollens": parse_pollens, "translations": project_translations})
+        self.history = PollenHistory(hass)
+        self.fetcher.async_add_listener("pollens", self.history.async_handle_pollens)
+        entry = SimpleNamespace(entry_id="replay", title="Replay", options={CONF_PROFILING: True}, data={})
+        self.coordinator = MyCoordinator(hass, entry, self.fetcher)
+        self.coordinator.history = self.history
+        self.fetcher.async_add_listener("pollens", self.coordinator.async_handle_pollens)
+        self.sensors = {}
+        self._remove_listeners = []
+
+    def add_new_sensors(self) -> None:
+        """Create a sensor for every new pollen, writing its rendered state like a platform would."""
+        for key, record in self.coordinator.pollen_by_key.items():
+            if key in self.sensors:
+                continue
+            sensor = PollenSensor(self.coordinator, record)
+            sensor.hass = self.hass
+            sensor.async_write_ha_state = lambda sensor=sensor: self.hass.states.async_set(
+                sensor.entity_id, sensor.state, {**sensor.extra_state_attributes, "friendly_name": sensor.name}
+            )
+            self._remove_listeners.append(self.coordinator.async_add_listener(sensor._handle_coordinator_update))
+            self.sensors[key] = sensor
+
+    async def async_play(self, payload) -> dict:
+        """Refresh with a payload, returning its timings in milliseconds."""
+        profiler = self.coordinator.profiler
+        refreshes = len(profiler.refreshes)
+        self.session.set_payload("pollens", payload)
+        start = time.perf_counter()
+        await self.coordinator.async_refresh()
+        wall = (time.perf_counter() - start) * 1000
+        # Sensors of new pollens are added after the refresh announcing them, as by the platform
+        self.add_new_sensors()
+        refresh = profiler.refreshes[-1] if len(profiler.refreshes) > refreshes else {}
+        return {
+            "pollens": len(self.coordinator.pollen_by_key),
+            "wall": wall,
+            "parse": refresh.get("parse") or 0.0,
+            "fan_out": refresh.get("fan_out", 0.0),
+            "rendered": refresh.get("rendered", 0),
+            "render": refresh.get("render", 0.0),
+        }
+
+    def close(self) -> None:
+        for remove_listener in self._remove_listeners:
+            remove_listener()
+
+
+async def replay(payloads, translations, repeat):
+    """Replay the payloads repeat times, returning the fastest timings of each and the last profiler."""
+    best = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for _ in range(repeat):
+            run = Replay(hass, translations)
+            gc.collect()
+            gc.disable()
+            try:
+                timings = [await run.async_play(payload) for payload in payloads]
+            finally:
+                gc.enable()
+                run.close()
+            if not best:
+                best = timings
+            else:
+                best = [min(old, new, key=lambda timing: timing["wall"]) for old, new in zip(best, timings)]
+        await hass.async_stop(force=True)
+    return best, run.coordinator.profiler
+
+
+def synthetic_payloads(count, pollens):
+    """Return count hourly /pollens payloads with changing counts."""
+    return [
+        make_pollens(pollens, seed=number, measurement_date=f"2024-07-{1 + number // 24:02d} {number % 24:02d}:00:12")
+        for number in range(count)
+    ]
+
+
+def report(names, timings, profiler):
+    print(f"{'payload':<24} {'pollens':>7} {'wall ms':>8} {'parse ms':>9} {'fan-out ms':>11} {'rendered':>9} {'render ms':>10} {'us/entity':>10}")
+    for name, timing in zip(names, timings):
+        per_entity = timing["render"] / timing["rendered"] * 1000 if timing["rendered"] else 0
+        print(
+            f"{name[-24:]:<24} {timing['pollens']:>7} {timing['wall']:>8.2f} {timing['parse']:>9.1f} "
+            f"{timing['fan_out']:>11.2f} {timing['rendered']:>9} {timing['render']:>10.2f} {per_entity:>10.1f}"
+        )
+    total = sum(timing["wall"] for timing in timings)
+    print(f"{len(timings)} payloads, {total:.1f} ms in total, {total / len(timings):.2f} ms per refresh")
+    slowest = list(profiler.as_dict()["entities"].items())[:5]
+    if slowest:
+        print("slowest sensors (mean ms): " + ", ".join(f"{entity_id} {stats['mean']}" for entity_id, stats in slowest))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("payloads", nargs="*", help="recorded /pollens responses, replayed in order")
+    parser.add_argument("--translations", help="recorded /translations response, synthetic translations otherwise")
+    parser.add_argument("--synthetic", type=int, default=24, help="synthetic payloads to replay when no files are given")
+    parser.add_argument("--pollens", type=int, default=12, help="pollen types of the synthetic payloads")
+    parser.add_argument("--repeat", type=int, default=5, help="replays of the sequence, the fastest is reported")
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    if args.payloads:
+        payloads = [load_payload(path) for path in args.payloads]
+        names = list(args.payloads)
+    else:
+        payloads = synthetic_payloads(args.synthetic, args.pollens)
+        names = [f"synthetic {number + 1}" for number in range(len(payloads))]
+    translations = load_payload(args.translations) if args.translations else make_translations(payloads[0])
+
+    timings, profiler = asyncio.run(replay(payloads, translations, args.repeat))
+    report(names, timings, profiler)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump({"payloads": dict(zip(names, timings)), **profiler.as_dict()}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,62 @@
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import ServiceCall, SupportsResponse
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.const import CONF_SCAN_INTERVAL, EVENT_CORE_CONFIG_UPDATE, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import ServiceCall, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.storage import Store
+import voluptuous as vol
 
 from datetime import timedelta, datetime
+import asyncio
 import logging
+import time
 
-from .const import DOMAIN, API_URL
+from .const import (
+    DOMAIN,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    STORAGE_SAVE_DELAY,
+    TRANSLATIONS_TTL,
+    READY_TIMEOUT,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_ENVIRONMENT,
+    DEFAULT_ENVIRONMENT,
+    CONF_LOCATIONS,
+    DEFAULT_LOCATIONS,
+    CONF_PROFILING,
+    DEFAULT_PROFILING,
+    FETCHER,
+    HISTORY,
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    GEOCODER,
+    GEOCODE_STORAGE_KEY,
+    GEOCODE_STORAGE_VERSION,
+    FORCE_POLL,
+    FORCE_POLL_DEBOUNCE,
+    FORCE_POLL_BURST,
+    FORCE_POLL_INTERVAL,
+)
+from .environment import EnvironmentCoordinator, parse_locations
+from .fetcher import SharedFetcher, TokenBucket
+from .history import PollenHistory
+from .metrics import create_trace_config
+from .models import PollenRecord, parse_pollens, project_translations
+from .profiling import RenderProfiler
+from .scheduler import AdaptiveScheduler, parse_measurement_date
+from .translator import Translator
 
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+FORCE_POLL_SCHEMA = vol.Schema({
+    vol.Optional("entry_id"): vol.All(cv.ensure_list, [cv.string]),
+})
+STATISTICS_SCHEMA = vol.Schema({
+    vol.Optional("pollen"): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional("days", default=7): vol.All(vol.Coerce(int), vol.Range(min=1, max=1095)),
+})
 
 async def async_setup(hass, config: dict) -> bool:
     """Set up the integration."""
@@ -21,9 +67,41 @@ async def async_setup(hass, config: dict) -> bool:
 async def async_setup_entry(hass, entry) -> bool:
     """Set up the integration from a config entry."""
     _LOGGER.debug("async_setup_entry()")
-    session = async_get_clientsession(hass)
-    coordinator = MyCoordinator(hass, entry, session)
-    await coordinator.async_config_entry_first_refresh()
+    if FETCHER not in hass.data:
+        # A session of its own, to trace the phases of its requests. It outlives the entry setting it
+        # up, being shared by all of them, and is closed when the last one is unloaded
+        session = async_create_clientsession(hass, auto_cleanup=False, trace_configs=[create_trace_config()])
+
+        async def async_close_session(event):
+            # Entries are not unloaded when Home Assistant stops
+            await session.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+        fetcher = SharedFetcher(session, parsers={"pollens": parse_pollens, "translations": project_translations})
+        # The history records every new /pollens payload once, whichever entry fetched it
+        history = PollenHistory(hass)
+        await history.async_load()
+        fetcher.async_add_listener("pollens", history.async_handle_pollens)
+        hass.data[FETCHER] = fetcher
+        hass.data[HISTORY] = history
+    coordinator = MyCoordinator(hass, entry, hass.data[FETCHER])
+    coordinator.history = hass.data[HISTORY]
+    entry.async_on_unload(coordinator.fetcher.async_add_listener("pollens", coordinator.async_handle_pollens))
+    entry.async_on_unload(hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, coordinator.async_handle_config_update))
+    if await coordinator.async_load_cache():
+        # Create the sensors from the cached payload right away and revalidate in the background
+        coordinator.async_set_updated_data(coordinator.cached_result())
+        entry.async_create_background_task(hass, coordinator.async_refresh(), f"{DOMAIN}_revalidate")
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    if entry.options.get(CONF_ENVIRONMENT, DEFAULT_ENVIRONMENT):
+        try:
+            locations = parse_locations(entry.options.get(CONF_LOCATIONS, DEFAULT_LOCATIONS))
+        except ValueError as err:
+            _LOGGER.error(f"Ignoring the further environment locations: {err}")
+            locations = []
+        coordinator.environment = EnvironmentCoordinator(hass, entry, coordinator.scan_interval, locations)
+        entry.async_create_background_task(hass, coordinator.environment.async_refresh(), f"{DOMAIN}_environment")
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     hass.async_create_task(
@@ -33,20 +111,72 @@ async def async_setup_entry(hass, entry) -> bool:
     if not entry.update_listeners:
         entry.async_on_unload(entry.add_update_listener(async_reload_entry))
         
-    # Launche the force_poll service call
     async def handle_force_poll_service(call: ServiceCall) -> dict:
         """Handle the force_poll service call."""
-        success = await coordinator.async_force_poll()
-        _LOGGER.debug(f"Force poll result: {success}")
-        hass.states.async_set("pollen_lu.force_poll", success)
-        return success
-        
-    # Register the force_poll service if not already registered
+        result = await async_force_poll(hass, call.data.get("entry_id"))
+        _LOGGER.debug(f"Force poll result: {result}")
+        return result
+
+    # Register the force_poll service if not already registered. It looks up the loaded entries on every call
     if not hass.services.has_service(DOMAIN, 'force_poll'):
-        hass.services.async_register(DOMAIN, 'force_poll', handle_force_poll_service,supports_response=SupportsResponse.ONLY)
+        hass.services.async_register(DOMAIN, 'force_poll', handle_force_poll_service, schema=FORCE_POLL_SCHEMA, supports_response=SupportsResponse.ONLY)
+
+    async def handle_statistics_service(call: ServiceCall) -> dict:
+        """Handle the statistics service call."""
+        history = hass.data.get(HISTORY)
+        if history is None:
+            return {"statistics": {}}
+        return {"statistics": history.statistics(call.data.get("pollen"), call.data["days"])}
+
+    if not hass.services.has_service(DOMAIN, 'statistics'):
+        hass.services.async_register(DOMAIN, 'statistics', handle_statistics_service, schema=STATISTICS_SCHEMA, supports_response=SupportsResponse.ONLY)
 
     return True
 
+async def async_force_poll(hass, entry_ids=None) -> dict:
+    """Force poll the given config entries, or all loaded ones, concurrently.
+
+    An entry being force polled joins that poll, and one force polled less
+    than FORCE_POLL_DEBOUNCE seconds ago returns its result. The others are
+    refreshed if the shared token bucket has a token left for this call.
+    """
+    start = time.perf_counter()
+    coordinators = hass.data.get(DOMAIN, {})
+    if entry_ids is None:
+        targets = dict(coordinators)
+    else:
+        unknown = [entry_id for entry_id in entry_ids if entry_id not in coordinators]
+        if unknown:
+            raise ServiceValidationError(f"No loaded Pollen.lu entry with ID {', '.join(unknown)}")
+        targets = {entry_id: coordinators[entry_id] for entry_id in entry_ids}
+    fetcher = hass.data.get(FETCHER)
+    stats = dict(fetcher.stats) if fetcher is not None else {}
+
+    modes = {entry_id: coordinator.force_poll_mode() for entry_id, coordinator in targets.items()}
+    bucket = hass.data.setdefault(FORCE_POLL, TokenBucket(FORCE_POLL_BURST, FORCE_POLL_INTERVAL))
+    # A call takes one token however many entries it refreshes, since they share their requests
+    rate_limited = "refreshed" in modes.values() and not bucket.acquire()
+    if rate_limited:
+        modes = {entry_id: "rate_limited" if mode == "refreshed" else mode for entry_id, mode in modes.items()}
+    for entry_id, coordinator in targets.items():
+        if modes[entry_id] == "refreshed":
+            # Start right away, so that calls arriving before the first await join instead of refreshing again
+            coordinator.async_start_force_poll()
+    results = await asyncio.gather(*(coordinator.async_force_poll(modes[entry_id]) for entry_id, coordinator in targets.items()))
+
+    response = {
+        "success": bool(results) and all(result["success"] for result in results),
+        "stale": any(result["stale"] for result in results),
+        "rate_limited": rate_limited,
+        "duration": round((time.perf_counter() - start) * 1000, 1),
+        "entries": dict(zip(targets, results)),
+        # Fetcher counters of this call, such as requests sent and results served from the cache
+        "cache": {counter: value - stats.get(counter, 0) for counter, value in fetcher.stats.items()} if fetcher is not None else {},
+    }
+    if rate_limited:
+        response["retry_in"] = round(bucket.retry_in)
+    return response
+
 async def async_unload_entry(hass, entry):
     """Unload a config entry."""
     _LOGGER.debug("async_unload_entry()")
@@ -54,12 +184,42 @@ async def async_unload_entry(hass, entry):
         unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
         if unload_ok:
             coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-            await coordinator.session.close()
+            # Pending delayed saves would otherwise land after a reloaded entry has loaded the stores
+            await coordinator.async_save_cache()
+            if not hass.data[DOMAIN]:
+                fetcher = hass.data.pop(FETCHER, None)
+                if fetcher is not None:
+                    await fetcher.session.close()
+                history = hass.data.pop(HISTORY, None)
+                if history is not None:
+                    await history.async_save()
+                geocoder = hass.data.pop(GEOCODER, None)
+                if geocoder is not None:
+                    await geocoder.async_save()
+                hass.data.pop(FORCE_POLL, None)
             return True
         return False
     _LOGGER.warning(f"Attempted to unload entry {entry.entry_id} that was not loaded.")
     return False
 
+async def async_remove_entry(hass, entry):
+    """Remove the cache of a deleted config entry, and the history and geocoding cache along with the last entry."""
+    _LOGGER.debug("async_remove_entry()")
+    await PollenStore(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}").async_remove()
+    if not [other for other in hass.config_entries.async_entries(DOMAIN) if other.entry_id != entry.entry_id]:
+        await Store(hass, HISTORY_STORAGE_VERSION, HISTORY_STORAGE_KEY).async_remove()
+        await Store(hass, GEOCODE_STORAGE_VERSION, GEOCODE_STORAGE_KEY).async_remove()
+
+class PollenStore(Store):
+    """Store of the cached payloads, migrating older cache formats."""
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        if old_major_version < 2 and old_data.get("pollen") is not None:
+            # Version 1 kept the raw /pollens payload instead of parsed records
+            old_data["pollen"] = [record.as_dict() for record in parse_pollens(old_data["pollen"])]
+            old_data.get("http_cache", {}).pop("pollens", None)
+        return old_data
+
 async def async_reload_entry(hass, entry):
     """Reload config entry when options are updated."""
     _LOGGER.debug("async_reload_entry()")
@@ -67,71 +227,333 @@ async def async_reload_entry(hass, entry):
     await async_setup_entry(hass, entry)
 
 class MyCoordinator(DataUpdateCoordinator):
-    def __init__(self, hass, entry, session):
+    def __init__(self, hass, entry, fetcher):
         """Initialize the coordinator."""
-        self.session = session
+        self.fetcher = fetcher
         self.entry = entry
         self.translations = None
+        self.translations_fetched = None
         self.pollen = None
+        self.pollen_by_key = {}
+        # Pollen keys whose record changed since listeners were last notified
+        self.changed_keys = set()
+        self._notified_success = True
+        self.poll_success = None
+        self._poll_listeners = []
+        # Names and descriptions in the system language, resolved once per translations payload
+        self.translator = Translator(hass.config.language)
         self.last_poll = None
         self.next_poll = None
-        self.headers = {
-            "Host": "pollen-api.chl.lu",
-            "Accept": "*/*",
-            "Content-Type": "application/json",
-            "Sec-Fetch-Site": "cross-site",
-            "Origin": "capacitor://localhost",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Sec-Fetch-Mode": "cors",
-            "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
-            "Accept-Language": "lb,en-GB;q=0.9,en;q=0.8",
-            "Sec-Fetch-Dest": "empty",
-            "Connection": "keep-alive",
-        }
-
+        self.expected_update = None
+        self.environment = None
+        self.history = None
+        # Whether the pollen counts are the last good ones, kept while the API fails
+        self.stale = False
+        # Duration (milliseconds) of the last listener notification and number of pollens it changed
+        self.fan_out = None
+        # Render times of the sensors and event loop time of each refresh, in profiling mode only
+        self.profiler = RenderProfiler() if entry.options.get(CONF_PROFILING, DEFAULT_PROFILING) else None
+        # Hash of the payload last applied per endpoint
+        self._hashes = {}
+        self._store = PollenStore(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}")
+        self._ready = asyncio.Event()
+        # Forced poll in progress, and the result and monotonic time of the last one
+        self._force_poll = None
+        self._force_poll_result = None
+        self._force_poll_time = 0.0
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 60))
         update_interval = timedelta(minutes=scan_interval)
-        _LOGGER.info(f"Polling pollen.lu API every {scan_interval} minutes")
+        self.scan_interval = update_interval
+        if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            self.scheduler = AdaptiveScheduler(max_interval=update_interval)
+            _LOGGER.info(f"Polling pollen.lu API adaptively, at most every {scan_interval} minutes and more often around expected updates")
+        else:
+            self.scheduler = None
+            _LOGGER.info(f"Polling pollen.lu API every {scan_interval} minutes")
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Only notify listeners when the returned data (which carries the payload hashes) changes
+            always_update=False,
         )
  
     async def _async_setup(self) -> None:
         """Fetch translations from API endpoint."""
         _LOGGER.debug("_async_setup()")
         try:
-            async with self.session.get(f"{API_URL}/translations", headers=self.headers) as response:
-                self.translations = await response.json()
-                self.translations = self.translations["data"]
-                _LOGGER.debug("Translations fetched")
+            await self._async_refresh_translations()
         except Exception as err:
             _LOGGER.error(f"Error fetching translations: {err}")
             raise UpdateFailed(f"Error fetching translations: {err}") from err
 
+    async def _async_refresh_translations(self) -> None:
+        """Fetch translations unless the cached ones are younger than TRANSLATIONS_TTL."""
+        now = datetime.now().astimezone()
+        if self.translations is not None and self.translations_fetched and now - self.translations_fetched < TRANSLATIONS_TTL:
+            return
+        try:
+            translations = await self._async_fetch("translations")
+        except Exception as err:
+            if self.translations is None:
+                raise
+            _LOGGER.warning(f"Error refreshing translations, keeping cached ones: {err}")
+            return
+        if translations is not None:
+            self.translations = translations
+            self._load_translations()
+            _LOGGER.debug("Translations fetched")
+        self.translations_fetched = now
+        self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+
     async def _async_update_data(self):
         """Fetch data from API endpoint."""
         _LOGGER.debug("_async_update_data()")
         success = True
         try:
-            async with self.session.get(f"{API_URL}/pollens", headers=self.headers) as response:
-                self.pollen = await response.json()
-                self.pollen = self.pollen["data"]
-                self.last_poll = datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S")
-                self.next_poll = (datetime.now().astimezone() + self.update_interval).strftime("%Y-%m-%d %H:%M:%S")
+            await self._async_refresh_translations()
+            applied = self._hashes.get("pollens")
+            pollen = await self._async_fetch("pollens")
+            self._set_stale(False)
+            if pollen is not None:
+                self._apply_pollen(pollen)
                 _LOGGER.debug("Pollen fetched")
+            elif self._hashes.get("pollens") != applied:
+                # A changed payload reaches every entry, this one included, through async_handle_pollens
+                _LOGGER.debug("Pollen fetched and applied by the shared fetcher")
+            else:
+                _LOGGER.debug("Pollen unchanged since last poll")
+            now = datetime.now().astimezone()
+            if self.scheduler is not None:
+                self._schedule_next_poll(now)
+            self.last_poll = now.strftime("%Y-%m-%d %H:%M:%S")
+            self.next_poll = (now + self.update_interval).strftime("%Y-%m-%d %H:%M:%S")
         except Exception as err:
-            _LOGGER.error(f"Error fetching pollen counts: {err}")
             success = False
-            raise UpdateFailed(f"Error fetching pollen counts: {err}")
-            
-        return {"success": success}
+            if self.pollen is None:
+                _LOGGER.error(f"Error fetching pollen counts: {err}")
+                raise UpdateFailed(f"Error fetching pollen counts: {err}")
+            # Keep the sensors available with the last good counts, marked as stale
+            _LOGGER.warning(f"Error fetching pollen counts, keeping the last known ones: {err}")
+            self._set_stale(True)
+            self.next_poll = (datetime.now().astimezone() + self.update_interval).strftime("%Y-%m-%d %H:%M:%S")
+        finally:
+            self.poll_success = success
+            self._async_update_poll_listeners()
+
+        return self.cached_result()
+
+    @callback
+    def async_add_poll_listener(self, update_callback):
+        """Listen for every poll, even when the payload did not change, returning a function to remove it."""
+        self._poll_listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            self._poll_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_update_poll_listeners(self) -> None:
+        for update_callback in list(self._poll_listeners):
+            update_callback()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, then start collecting changed pollen keys anew."""
+        if self.last_update_success != self._notified_success:
+            # Availability of every sensor changed
+            self._notified_success = self.last_update_success
+            self.changed_keys |= self.pollen_by_key.keys()
+        start = time.perf_counter()
+        super().async_update_listeners()
+        duration = (time.perf_counter() - start) * 1000
+        self.fan_out = {"duration": round(duration, 1), "changed": len(self.changed_keys)}
+        self.changed_keys = set()
+        if self.profiler is not None:
+            refresh = self.profiler.record_refresh(duration)
+            _LOGGER.debug(f"Refresh occupied the event loop for {refresh['occupancy']} ms, rendering {refresh['rendered']} sensors in {refresh['render']} ms")
+
+    def _apply_pollen(self, pollen) -> None:
+        """Use a new pollen payload and persist it."""
+        self.pollen = pollen
+        self._build_pollen_index()
+        self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
 
-    async def async_force_poll(self) -> dict:
-        """Handle the action call to force poll the API."""
+    def _set_stale(self, stale) -> None:
+        """Mark the pollen counts as outdated or current, updating every sensor when that changes."""
+        if stale != self.stale:
+            self.stale = stale
+            self.changed_keys |= self.pollen_by_key.keys()
+
+    @callback
+    def async_handle_pollens(self, result) -> None:
+        """Apply a pollen payload fetched by the shared fetcher, possibly for another entry."""
+        if result.hash == self._hashes.get("pollens"):
+            return
+        self._hashes["pollens"] = result.hash
+        if self.profiler is not None:
+            metrics = self.fetcher.metrics.get("pollens")
+            self.profiler.record_parse(metrics.parse if metrics is not None else None)
+        self._set_stale(False)
+        self._apply_pollen(result.data)
+        self.async_set_updated_data(self.cached_result())
+
+    def _schedule_next_poll(self, now) -> None:
+        """Align the update interval to the expected next upstream publication."""
+        measurements = [parse_measurement_date(record.last_update) for record in self.pollen_by_key.values()]
+        measurements = [measurement for measurement in measurements if measurement is not None]
+        if measurements and self.scheduler.observe(max(measurements)):
+            _LOGGER.debug(f"New measurement published, upstream cadence is {self.scheduler.cadence}")
+        self.update_interval = self.scheduler.next_interval(now)
+        expected = self.scheduler.expected_update
+        self.expected_update = expected.strftime("%Y-%m-%d %H:%M:%S") if expected else None
+        _LOGGER.debug(f"Next poll in {self.update_interval}, next update expected at {self.expected_update}")
+
+    def cached_result(self) -> dict:
+        """Return the coordinator data matching the currently loaded pollen and translations payloads."""
+        # Listeners are only notified when this changes, so it carries the hash of both payloads
+        return {
+            "success": True,
+            "hash": self._hashes.get("pollens"),
+            "translations": self._hashes.get("translations"),
+            "stale": self.stale,
+        }
+
+    async def async_load_cache(self) -> bool:
+        """Load the last good payloads from disk, returning True if sensors can be created from them."""
+        cache = await self._store.async_load()
+        if not cache:
+            return False
+        http_cache = cache.get("http_cache", {})
+        if cache.get("translations") is not None:
+            self.translations = project_translations(cache["translations"])
+            if cache.get("translations_fetched"):
+                self.translations_fetched = datetime.fromisoformat(cache["translations_fetched"])
+            self._seed("translations", self.translations, http_cache.get("translations", {}))
+            self._load_translations()
+        if cache.get("pollen") is not None:
+            self.pollen = tuple(PollenRecord.from_dict(record) for record in cache["pollen"])
+            self._seed("pollens", self.pollen, http_cache.get("pollens", {}))
+            self.last_poll = cache.get("last_poll")
+            self._build_pollen_index()
+        _LOGGER.debug("Cache loaded")
+        return self.pollen is not None and self.translations is not None
+
+    async def async_save_cache(self) -> None:
+        """Write the cache now, replacing a pending delayed save."""
+        await self._store.async_save(self._cache_data())
+
+    def _seed(self, endpoint, data, validators) -> None:
+        """Mark a cached payload as applied and offer it to the shared fetcher."""
+        self._hashes[endpoint] = validators.get("hash")
+        self.fetcher.seed(endpoint, data, validators)
+
+    def _cache_data(self) -> dict:
+        """Return the payloads and validators to persist."""
+        return {
+            "http_cache": {endpoint: self.fetcher.validators(endpoint) for endpoint in ("translations", "pollens")},
+            "translations": self.translations,
+            "translations_fetched": self.translations_fetched.isoformat() if self.translations_fetched else None,
+            "pollen": [record.as_dict() for record in self.pollen] if self.pollen is not None else None,
+            "last_poll": self.last_poll,
+        }
+
+    async def _async_fetch(self, endpoint):
+        """Fetch an API endpoint through the shared fetcher, returning its data or None if already applied."""
+        result = await self.fetcher.async_fetch(endpoint)
+        if result.hash == self._hashes.get(endpoint):
+            return None
+        self._hashes[endpoint] = result.hash
+        return result.data
+
+    def _build_pollen_index(self) -> None:
+        """Index pollen records by translation key and collect the keys whose record changed."""
+        pollen_by_key = {record.key: record for record in self.pollen or ()}
+        self.changed_keys |= {
+            key for key in pollen_by_key.keys() | self.pollen_by_key.keys()
+            if pollen_by_key.get(key) != self.pollen_by_key.get(key)
+        }
+        self.pollen_by_key = pollen_by_key
+        self._update_ready()
+
+    def _load_translations(self) -> None:
+        """Compile the translations payload into the translator."""
+        self.translator.load(self.translations)
+        # Names and descriptions of every sensor may have changed
+        self.changed_keys |= self.pollen_by_key.keys()
+        self._update_ready()
+
+    def _update_ready(self) -> None:
+        """Signal readiness once both pollen counts and translations are available."""
+        if self.pollen is not None and self.translations is not None:
+            self._ready.set()
+
+    async def async_wait_ready(self, timeout=READY_TIMEOUT) -> None:
+        """Wait until pollen counts and translations are available.
+
+        Raises TimeoutError naming the missing payloads if they are not available within timeout seconds.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self._ready.wait()
+        except TimeoutError:
+            missing = [name for name, value in (("pollens", self.pollen), ("translations", self.translations)) if value is None]
+            raise TimeoutError(f"No {' and '.join(missing)} received within {timeout} seconds") from None
+
+    def translate(self, key, domain):
+        """Return the content of key in the system language or its fallbacks, or the key itself if unknown."""
+        return self.translator.translate(key, domain)
+
+    @callback
+    def async_handle_config_update(self, event) -> None:
+        """Translate the sensors anew when the system language changes."""
+        if self.translator.set_language(self.hass.config.language):
+            _LOGGER.debug(f"Translating to {self.hass.config.language}, falling back to {self.translator.chain}")
+            self.changed_keys |= self.pollen_by_key.keys()
+            self.async_update_listeners()
+
+    def force_poll_mode(self) -> str:
+        """Return how a force poll would be served: joining the one in progress, with the last result, or by refreshing."""
+        if self._force_poll is not None:
+            return "joined"
+        if self._force_poll_result is not None and time.monotonic() - self._force_poll_time < FORCE_POLL_DEBOUNCE:
+            return "debounced"
+        return "refreshed"
+
+    async def async_force_poll(self, mode="refreshed") -> dict:
+        """Handle the action call to force poll the API, as decided by force_poll_mode or the rate limit."""
+        if mode in ("refreshed", "joined"):
+            # Shield the shared refresh so a cancelled caller does not cancel it for the others
+            result = await asyncio.shield(self.async_start_force_poll())
+        elif mode == "debounced":
+            result = self._force_poll_result
+        else:
+            result = {"success": bool(self.poll_success), "stale": self.stale, "duration": None}
+        return {"title": self.entry.title, "mode": mode, **result}
+
+    @callback
+    def async_start_force_poll(self):
+        """Start a forced refresh unless one is in progress, returning its task."""
+        if self._force_poll is None:
+            self._force_poll = asyncio.get_running_loop().create_task(self._async_force_poll())
+            self._force_poll.add_done_callback(self._clear_force_poll)
+        return self._force_poll
+
+    def _clear_force_poll(self, task) -> None:
+        self._force_poll = None
+
+    async def _async_force_poll(self) -> dict:
         _LOGGER.info("Force poll action called")
-        success = await self._async_update_data()
-        return success
\ No newline at end of file
+        start = time.perf_counter()
+        await self.async_refresh()
+        self._force_poll_result = {
+            "success": bool(self.poll_success),
+            "stale": self.stale,
+            "duration": round((time.perf_counter() - start) * 1000, 1),
+        }
+        self._force_poll_time = time.monotonic()
+        return self._force_poll_result
\ No newline at end of file
@@ -2,10 +2,20 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_NAME
 from homeassistant.core import callback
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 from .const import (
     DOMAIN,
-    DEFAULT_SCAN_INTERVAL
+    DEFAULT_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    DEFAULT_ADAPTIVE_POLLING,
+    CONF_ENVIRONMENT,
+    DEFAULT_ENVIRONMENT,
+    CONF_LOCATIONS,
+    DEFAULT_LOCATIONS,
+    CONF_PROFILING,
+    DEFAULT_PROFILING,
 )
+from .environment import parse_locations
 
 DEFAULT_CONF_NAME = "Pollen.lu"
 
@@ -56,8 +66,14 @@ class PollenLuOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            try:
+                parse_locations(user_input.get(CONF_LOCATIONS, DEFAULT_LOCATIONS))
+            except ValueError:
+                errors[CONF_LOCATIONS] = "invalid_locations"
+            else:
+                return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
             step_id="init",
@@ -66,6 +82,27 @@ class PollenLuOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_SCAN_INTERVAL, 
                     default=self.config_entry.options.get(CONF_SCAN_INTERVAL, 
                     DEFAULT_SCAN_INTERVAL)
-                    ): int
+                    ): int,
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=self.config_entry.options.get(CONF_ADAPTIVE_POLLING,
+                    DEFAULT_ADAPTIVE_POLLING)
+                    ): bool,
+                vol.Required(
+                    CONF_ENVIRONMENT,
+                    default=self.config_entry.options.get(CONF_ENVIRONMENT,
+                    DEFAULT_ENVIRONMENT)
+                    ): bool,
+                vol.Optional(
+                    CONF_LOCATIONS,
+                    default=self.config_entry.options.get(CONF_LOCATIONS,
+                    DEFAULT_LOCATIONS)
+                    ): TextSelector(TextSelectorConfig(multiline=True)),
+                vol.Required(
+                    CONF_PROFILING,
+                    default=self.config_entry.options.get(CONF_PROFILING,
+                    DEFAULT_PROFILING)
+                    ): bool,
             }),
-        )
\ No newline at end of file
+            errors=errors,
+        )
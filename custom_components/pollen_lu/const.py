@@ -1,6 +1,94 @@
+from datetime import timedelta
+
 DOMAIN = "pollen_lu"
 NAME = "Pollen.lu"
 
 API_URL = "https://pollen-api.chl.lu/api"
 
+# Environmental data from data.public.lu and geocoding from geoportail.lu
+API_O3 = "https://data.public.lu/fr/datasets/r/c50542d0-ce59-4565-a8cb-48544ac18576"
+API_NO2 = "https://data.public.lu/fr/datasets/r/5ce7c6fe-fc4c-4b5e-84c9-8d97b6a21c81"
+API_GML = "https://data.public.lu/fr/datasets/r/93c90cb8-4994-4be7-bcaa-cabe0e66ad9a"
+GEOPORTAIL_URL = "https://api.geoportail.lu/geocode"
+
+# Per-source timeouts (seconds) and retry budget of the environmental data refresh
+ENVIRONMENT_TIMEOUTS = {"o3": 20, "no2": 20, "weather": 60}
+ENVIRONMENT_RETRIES = 2
+ENVIRONMENT_RETRY_DELAY = 2
+# Nearest O3 / NO2 grid cells whose inverse-distance weighted value is reported as interpolated_value
+GRID_NEIGHBOURS = 4
+
 DEFAULT_SCAN_INTERVAL = 60
+
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+DEFAULT_ADAPTIVE_POLLING = False
+
+CONF_ENVIRONMENT = "environment"
+DEFAULT_ENVIRONMENT = False
+
+# Further environment locations, one "name: latitude, longitude" per line, besides the Home Assistant location
+CONF_LOCATIONS = "locations"
+DEFAULT_LOCATIONS = ""
+HOME_LOCATION = "home"
+
+# Profiling of sensor rendering, and the number of refreshes it keeps
+CONF_PROFILING = "profiling"
+DEFAULT_PROFILING = False
+PROFILING_REFRESHES = 50
+
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_VERSION = 2
+STORAGE_SAVE_DELAY = 10
+
+TRANSLATIONS_TTL = timedelta(days=7)
+# Locale of the translations used when the system language has none
+TRANSLATION_FALLBACK_LOCALE = "en"
+
+READY_TIMEOUT = 60
+
+# Key of the SharedFetcher in hass.data, and how long (seconds) its results are served without a request
+FETCHER = f"{DOMAIN}_fetcher"
+FETCH_MIN_AGE = 60
+
+# Key of the PollenHistory in hass.data, its storage, and how long raw samples and daily aggregates are kept
+HISTORY = f"{DOMAIN}_history"
+HISTORY_STORAGE_KEY = f"{DOMAIN}.history"
+HISTORY_STORAGE_VERSION = 1
+HISTORY_RAW_RETENTION = timedelta(days=14)
+HISTORY_DAILY_RETENTION = timedelta(days=3 * 365)
+
+# Number of samples of the trend slope, smoothing factor of its moving average,
+# and the slope (counts per day) below which a pollen count is considered steady
+TREND_SAMPLES = 8
+TREND_EMA_ALPHA = 0.3
+TREND_STEADY_SLOPE = 1.0
+
+# Per-attempt timeout (seconds) of pollen.lu API requests, retries of transient errors and their base delay
+FETCH_TIMEOUT = 30
+FETCH_RETRIES = 2
+FETCH_RETRY_DELAY = 2
+
+# Consecutive failures after which an endpoint is not requested for a cooling period (seconds),
+# doubled on every failure after it until the maximum
+CIRCUIT_FAILURES = 3
+CIRCUIT_COOLDOWN = 300
+CIRCUIT_MAX_COOLDOWN = 3600
+
+# Key of the force_poll rate limit in hass.data. Forced polls of an entry within FORCE_POLL_DEBOUNCE
+# seconds of its last one return that result, and a token bucket allows bursts of FORCE_POLL_BURST
+# refreshing calls, refilled with one token every FORCE_POLL_INTERVAL seconds
+FORCE_POLL = f"{DOMAIN}_force_poll"
+FORCE_POLL_DEBOUNCE = 10
+FORCE_POLL_BURST = 3
+FORCE_POLL_INTERVAL = 60
+
+# Key of the Geocoder in hass.data, its persistent cache, how long found and missing
+# locations are kept, concurrent requests of a batch, and decimals of cached coordinates
+GEOCODER = f"{DOMAIN}_geocoder"
+GEOCODE_STORAGE_KEY = f"{DOMAIN}.geocode"
+GEOCODE_STORAGE_VERSION = 1
+GEOCODE_CACHE_SIZE = 256
+GEOCODE_TTL = timedelta(days=30)
+GEOCODE_MISS_TTL = timedelta(days=1)
+GEOCODE_CONCURRENCY = 4
+GEOCODE_PRECISION = 4
@@ -0,0 +1,45 @@
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import DOMAIN, FETCHER, CONF_LOCATIONS
+
+# The further environment locations are exact coordinates of places of the user
+TO_REDACT = {CONF_LOCATIONS}
+
+
+async def async_get_config_entry_diagnostics(hass, entry) -> dict:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    fetcher = hass.data[FETCHER]
+    diagnostics = {
+        "options": async_redact_data(entry.options, TO_REDACT),
+        "poll": {
+            "success": coordinator.poll_success,
+            "stale": coordinator.stale,
+            "last_update_success": coordinator.last_update_success,
+            "last_poll": coordinator.last_poll,
+            "next_poll": coordinator.next_poll,
+            "expected_update": coordinator.expected_update,
+            "update_interval": str(coordinator.update_interval),
+        },
+        "payloads": {
+            "pollens": len(coordinator.pollen) if coordinator.pollen is not None else None,
+            "translations": len(coordinator.translations) if coordinator.translations is not None else None,
+            "translations_fetched": coordinator.translations_fetched.isoformat() if coordinator.translations_fetched else None,
+        },
+        "translator": coordinator.translator.as_dict(),
+        "fan_out": coordinator.fan_out,
+        "fetcher": {
+            "stats": dict(fetcher.stats),
+            "endpoints": {endpoint: metrics.as_dict() for endpoint, metrics in fetcher.metrics.items()},
+            "circuit_breakers": {endpoint: breaker.as_dict() for endpoint, breaker in fetcher.breakers.items()},
+        },
+    }
+    if coordinator.profiler is not None:
+        diagnostics["profiling"] = coordinator.profiler.as_dict()
+    if coordinator.environment is not None:
+        diagnostics["environment"] = {
+            "last_update_success": coordinator.environment.last_update_success,
+            "locations": list(coordinator.environment.names),
+            "stale": (coordinator.environment.data or {}).get("stale", []),
+        }
+    return diagnostics
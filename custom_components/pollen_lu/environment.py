@@ -0,0 +1,700 @@
+from functools import lru_cache
+import asyncio
+import heapq
+import logging
+import math
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    API_O3,
+    API_NO2,
+    API_GML,
+    ENVIRONMENT_TIMEOUTS,
+    ENVIRONMENT_RETRIES,
+    ENVIRONMENT_RETRY_DELAY,
+    GRID_NEIGHBOURS,
+    HOME_LOCATION,
+)
+from .fetcher import json_loads
+from .geocoding import async_get_geocoder
+
+_LOGGER = logging.getLogger(__name__)
+
+NO_CACHE_HEADERS = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+CHUNK_SIZE = 64 * 1024
+
+NAMESPACES = {
+    "gml": "http://www.opengis.net/gml/3.2",
+    "om": "http://www.opengis.net/om/2.0",
+    "omso": "http://inspire.ec.europa.eu/schemas/omso/3.0",
+    "swe": "http://www.opengis.net/swe/1.0/gml32",
+}
+FEATURE_MEMBER = f"{{{NAMESPACES['gml']}}}featureMember"
+
+# GPS, LUREF (O3/NO2 grids) and ETRS89 (weather stations) coordinate reference systems
+WGS84 = "EPSG:4326"
+LUREF = "EPSG:2169"
+ETRS89 = "EPSG:3035"
+
+
+def get_home_location(hass):
+    latitude = hass.config.latitude
+    longitude = hass.config.longitude
+    return latitude, longitude
+
+
+@lru_cache(maxsize=None)
+def get_transformer(source, target):
+    """Return a cached transformer between two coordinate reference systems.
+
+    pyproj is imported here rather than at module level since importing it
+    and building transformers is slow; call this from an executor first.
+    """
+    from pyproj import Transformer
+
+    return Transformer.from_crs(source, target, always_xy=True)
+
+
+@lru_cache(maxsize=None)
+def get_numpy():
+    """Return the numpy module for the vectorized grid searches, or None if it is not installed.
+
+    Imported on first use rather than at module level, so installations
+    without environment sensors do not pay for it; call this from an executor first.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def project_location(latitude, longitude):
+    """Return the LUREF and ETRS89 coordinates of a GPS location."""
+    x_luref, y_luref = get_transformer(WGS84, LUREF).transform(longitude, latitude)
+    x_etrs89, y_etrs89 = get_transformer(WGS84, ETRS89).transform(longitude, latitude)
+    return (x_luref, y_luref), (x_etrs89, y_etrs89)
+
+
+def convert_gmtp1_to_local_time(date_str, time_str):
+    # Combine date, time, and the GMT+1 offset into a single string
+    dt_str = f"{date_str} {time_str} +0100"
+    # Define the format of the input date and time, including the timezone offset
+    dt_format = "%d.%m.%Y %H:%M %z"
+    # Parse the date and time string into a timezone-aware datetime object
+    dt = datetime.strptime(dt_str, dt_format)
+    # Convert to the local time of the OS
+    local_time = dt.astimezone().strftime("%d.%m.%Y %H:%M")
+    # Split the local time into date and time components
+    local_date, local_time = local_time.split(" ")
+    return local_date, local_time
+
+
+def calculate_distance(x1, y1, x2, y2):
+    return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+
+
+async def async_fetch_json_data(hass, session, api_url, locators):
+    """Download a grid JSON document and return extract_json_data for each locator.
+
+    Decoding the document and searching its grid are CPU-bound, so both run in an executor.
+    """
+    try:
+        async with session.get(api_url, headers=NO_CACHE_HEADERS) as response:
+            response.raise_for_status()
+            body = await response.read()
+    except Exception as err:
+        _LOGGER.error(f"An error occurred in fetch_json_data: {err}")
+        return [False for _ in locators]
+    return await hass.async_add_executor_job(extract_json_body_many, body, locators)
+
+
+async def async_fetch_gml_data(hass, session, api_url, locators):
+    """Stream the weather GML document and return the observation of the station nearest to each locator.
+
+    The chunks are parsed in an executor as they arrive, keeping the event loop free meanwhile.
+    """
+    parser = GmlStationParser(locators)
+    try:
+        async with session.get(api_url, headers=NO_CACHE_HEADERS) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                await hass.async_add_executor_job(parser.feed, chunk)
+                if parser.done:
+                    # The known nearest stations have been found, skip the rest of the document
+                    break
+        return await hass.async_add_executor_job(parser.close)
+    except Exception as err:
+        _LOGGER.error(f"An error occurred in fetch_gml_data: {err}")
+        return [False for _ in locators]
+
+
+def parse_gc_id(gc_id):
+    """Return the (x, y) coordinates encoded in a grid cell id like 'X-76000:Y-75000'."""
+    _x, _y = map(int, gc_id.replace("X-", "").replace("Y-", "").split(":"))
+    return _x, _y
+
+
+def grid_coordinates(grid):
+    """Parse the gc_id of every grid cell in bulk into an (n, 2) NumPy array, or None if malformed."""
+    np = get_numpy()
+    text = " ".join(item["gc_id"] for item in grid).replace("X-", "").replace("Y-", "").replace(":", " ")
+    coordinates = np.fromstring(text, dtype=np.int64, sep=" ")
+    if coordinates.size != 2 * len(grid):
+        return None
+    return coordinates.reshape(-1, 2)
+
+
+def nearest_cells_python(grid, x, y, k=1):
+    """Return [(distance, index)] of the k grid cells nearest to (x, y), nearest first."""
+    if k == 1:
+        nearest = None
+        min_distance = float("inf")
+        for index, item in enumerate(grid):
+            _x, _y = parse_gc_id(item["gc_id"])
+            # Calculate the distance from the target coordinates
+            distance = calculate_distance(_x, _y, x, y)
+            # Check if this is the closest gc_id so far
+            if distance < min_distance:
+                min_distance = distance
+                nearest = index
+        return [] if nearest is None else [(min_distance, nearest)]
+    return heapq.nsmallest(
+        k,
+        ((calculate_distance(*parse_gc_id(item["gc_id"]), x, y), index) for index, item in enumerate(grid)),
+    )
+
+
+def nearest_cells_numpy(grid, x, y, k=1):
+    """Vectorized nearest_cells_python, returning the same cells in the same order."""
+    coordinates = grid_coordinates(grid)
+    if coordinates is None:
+        return nearest_cells_python(grid, x, y, k)
+    return _nearest_coordinates(coordinates, x, y, k)
+
+
+def _nearest_coordinates(coordinates, x, y, k):
+    np = get_numpy()
+    distances = np.sqrt((coordinates[:, 0] - x) ** 2 + (coordinates[:, 1] - y) ** 2)
+    if k == 1:
+        # argmin returns the first minimum, like the strict comparison of the loop
+        index = int(np.argmin(distances))
+        return [(float(distances[index]), index)]
+    k = min(k, len(coordinates))
+    candidates = np.argpartition(distances, k - 1)[:k]
+    # Order by distance, then index, to break ties like heapq.nsmallest
+    candidates = candidates[np.lexsort((candidates, distances[candidates]))]
+    return [(float(distances[index]), int(index)) for index in candidates]
+
+
+def nearest_cells_many_python(grid, points, k=1):
+    """Return nearest_cells_python for each (x, y) of points, parsing every grid cell only once."""
+    # Max-heaps of (-distance, -index), so the root is the farthest of the k nearest cells
+    heaps = [[] for _ in points]
+    for index, item in enumerate(grid):
+        _x, _y = parse_gc_id(item["gc_id"])
+        for heap, (x, y) in zip(heaps, points):
+            entry = (-calculate_distance(_x, _y, x, y), -index)
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+    return [sorted((-distance, -index) for distance, index in heap) for heap in heaps]
+
+
+def nearest_cells_many(grid, points, k=1):
+    """Return [(distance, index)] of the k grid cells nearest to each (x, y) of points, parsing the grid once."""
+    if not grid:
+        return [[] for _ in points]
+    if get_numpy() is not None:
+        coordinates = grid_coordinates(grid)
+        if coordinates is not None:
+            return [_nearest_coordinates(coordinates, x, y, k) for x, y in points]
+    return nearest_cells_many_python(grid, points, k)
+
+
+def nearest_cells(grid, x, y, k=1):
+    """Return [(distance, index)] of the k grid cells nearest to (x, y), using NumPy when available."""
+    return nearest_cells_many(grid, [(x, y)], k)[0]
+
+
+class GridLocator:
+    """Find the grid cell nearest to a fixed location.
+
+    The position of the nearest cell in the grid is remembered, so as long as
+    the grid layout does not change a lookup is a single index access. With
+    neighbours > 1 the inverse-distance weights of that many nearest cells are
+    remembered as well, for interpolate().
+    """
+
+    def __init__(self, x, y, neighbours=0, power=2):
+        self.x = x
+        self.y = y
+        self.neighbours = neighbours
+        self.power = power
+        self.index = None
+        self.gc_id = None
+        self._weights = None
+
+    def is_located(self, grid) -> bool:
+        """Return whether the remembered nearest cell is still valid for grid."""
+        return self.index is not None and self.index < len(grid) and grid[self.index]["gc_id"] == self.gc_id
+
+    def locate(self, grid):
+        """Return the grid item nearest to the location."""
+        if self.is_located(grid):
+            return grid[self.index]
+        # The grid layout changed (or first lookup): scan it once
+        return self.use_cells(grid, nearest_cells(grid, self.x, self.y, max(1, self.neighbours)))
+
+    def use_cells(self, grid, cells):
+        """Remember the nearest cells found by a scan of grid, returning the nearest item."""
+        self.index = None
+        if not cells:
+            return None
+        self.index = cells[0][1]
+        self.gc_id = grid[self.index]["gc_id"]
+        self._weights = self._inverse_distance_weights(cells)
+        _LOGGER.debug(f"Nearest grid cell is {self.gc_id}")
+        return grid[self.index]
+
+    def _inverse_distance_weights(self, cells):
+        """Return [(index, weight)] normalized inverse-distance weights of cells."""
+        if cells[0][0] == 0:
+            # The location is exactly on a cell
+            return [(cells[0][1], 1.0)]
+        weights = [(index, 1 / distance ** self.power) for distance, index in cells]
+        total = sum(weight for _, weight in weights)
+        return [(index, weight / total) for index, weight in weights]
+
+    def interpolate(self, grid):
+        """Return the inverse-distance weighted value of the nearest cells."""
+        if self.locate(grid) is None:
+            return None
+        return sum(grid[index]["value"] * weight for index, weight in self._weights)
+
+
+def locate_all(grid, locators) -> None:
+    """Scan grid once for all locators whose nearest cells are not known yet."""
+    pending = [locator for locator in locators if not locator.is_located(grid)]
+    if not pending:
+        return
+    k = max(max(1, locator.neighbours) for locator in pending)
+    for locator, cells in zip(pending, nearest_cells_many(grid, [(locator.x, locator.y) for locator in pending], k)):
+        locator.use_cells(grid, cells[:max(1, locator.neighbours)])
+
+
+def extract_json_body_many(body, locators):
+    """Decode a grid JSON document and return extract_json_data_many for it."""
+    try:
+        data = json_loads(body)
+    except ValueError as err:
+        _LOGGER.error(f"An error occurred in extract_json_body_many: {err}")
+        return [False for _ in locators]
+    return extract_json_data_many(data, locators)
+
+
+def extract_json_data_many(data, locators):
+    """Return extract_json_data for each locator, scanning the grid once for all of them."""
+    if not data:
+        return [False for _ in locators]
+    try:
+        locate_all(data["grid"], locators)
+    except Exception as err:
+        _LOGGER.error(f"An error occurred in extract_json_data_many: {err}")
+        return [False for _ in locators]
+    return [extract_json_data(data, locator) for locator in locators]
+
+
+def extract_json_data(data, locator):
+    if not data:
+        return False
+    result = {}
+    try:
+        item = locator.locate(data["grid"])
+        result = {
+            "date": data["date"],
+            "hour": data["hour"],
+            "gc_id": item["gc_id"] if item else None,
+            "value": item["value"] if item else None,
+            "index": item["index"] if item else None,
+        }
+        if locator.neighbours > 1:
+            result["interpolated_value"] = locator.interpolate(data["grid"])
+    except Exception as err:
+        _LOGGER.error(f"An error occurred in extract_json_data: {err}")
+        return False
+    return result
+
+
+def get_value_by_name(name, data_array):
+    """
+    Returns the value associated with a given name from a list of dictionaries.
+
+    Parameters:
+    - name (str): The name to search for.
+    - data_array (list): A list of dictionaries containing 'name', 'code', and 'value'.
+
+    Returns:
+    - str: The value associated with the given name, or None if not found.
+    """
+    for item in data_array:
+        if item["name"] == name:
+            return item["value"]
+    return None
+
+
+def parse_station_position(feature_member):
+    """Return the stripped gml:pos text of the station of a featureMember element, or None."""
+    pos = feature_member.find(".//gml:Point/gml:pos", NAMESPACES)
+    if pos is None or not pos.text:
+        return None
+    return pos.text.strip()
+
+
+def parse_pos(pos):
+    """Return (x, y, alt) from a gml:pos text, which lists northing before easting."""
+    coordinates = pos.split()
+    _y = float(coordinates[0])
+    _x = float(coordinates[1])
+    alt = float(coordinates[2]) if len(coordinates) > 2 else None
+    return _x, _y, alt
+
+
+class StationLocator:
+    """Remember the weather station nearest to a fixed location.
+
+    Stations are identified by their gml:pos text. Once known, the nearest
+    station is matched by string comparison instead of distance.
+    """
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.pos = None
+        self._lonlat = {}
+
+    def lonlat(self, pos):
+        """Return the GPS coordinates of a station, converting each station only once."""
+        if pos not in self._lonlat:
+            station_x, station_y, _ = parse_pos(pos)
+            self._lonlat[pos] = get_transformer(ETRS89, WGS84).transform(station_x, station_y)
+        return self._lonlat[pos]
+
+
+def parse_observation(feature_member):
+    """Return the last observation row of a featureMember as a list of name/code/value dicts."""
+    observation = feature_member.find(f".//{{{NAMESPACES['omso']}}}PointTimeSeriesObservation")
+    if observation is None:
+        return None
+    data_array = observation.find(".//swe:DataArray", NAMESPACES)
+    if data_array is None:
+        return None
+
+    # Extract field names and codes
+    field_names = []
+    field_codes = []
+    for field in data_array.findall(".//swe:field", NAMESPACES):
+        name = field.find("swe:name", NAMESPACES)
+        code = field.find(".//swe:uom", NAMESPACES)
+
+        # Extract the name from the 'name' attribute
+        if name is not None and "name" in name.attrib:
+            field_names.append(name.attrib["name"].strip())
+        else:
+            field_names.append("Unknown")
+
+        if code is not None and "code" in code.attrib:
+            # The upstream document double-encodes the degree sign
+            field_codes.append(code.attrib["code"].strip().replace("Â°C", "°C"))
+        else:
+            field_codes.append("Unknown")
+
+    values_element = data_array.find(".//swe:values", NAMESPACES)
+    if values_element is None or not values_element.text:
+        return None
+    # Pair the most recent row of values with field names and codes
+    value_parts = values_element.text.strip().split("\n")[-1].split(";")
+    return [
+        {"name": field_names[i], "code": field_codes[i], "value": value_parts[i]}
+        for i in range(min(len(field_names), len(value_parts)))
+    ]
+
+
+class NearestStation:
+    """The station nearest to one locator seen so far while parsing a GML document."""
+
+    __slots__ = ("locator", "min_distance", "station", "observation_data", "done")
+
+    def __init__(self, locator):
+        self.locator = locator
+        self.min_distance = float("inf")
+        self.station = None
+        self.observation_data = None
+        # Set once the already known nearest station has been found
+        self.done = False
+
+    def consider(self, pos, element) -> None:
+        """Keep a station if it is the known nearest one or nearer than every station seen so far."""
+        if self.done:
+            return
+        if pos == self.locator.pos:
+            observation_data = parse_observation(element)
+            if observation_data is not None:
+                self.station = pos
+                self.observation_data = observation_data
+                self.done = True
+            return
+        _x, _y, _ = parse_pos(pos)
+        distance = calculate_distance(_x, _y, self.locator.x, self.locator.y)
+        if distance < self.min_distance:
+            observation_data = parse_observation(element)
+            if observation_data is not None:
+                self.min_distance = distance
+                self.station = pos
+                self.observation_data = observation_data
+
+    def result(self):
+        if self.station is None:
+            return False
+        station_x, station_y, station_alt = parse_pos(self.station)
+        observation_data = self.observation_data
+        result = {
+            "station_x": station_x,
+            "station_y": station_y,
+            "station_alt": station_alt,
+        }
+        result["station_lon"], result["station_lat"] = self.locator.lonlat(self.station)
+        local_date, local_time = convert_gmtp1_to_local_time(
+            get_value_by_name("Date", observation_data),
+            get_value_by_name("Hour", observation_data),
+        )
+
+        result["date"] = local_date
+        result["time"] = local_time
+
+        result["temp"] = get_value_by_name(
+            "Average Air Temperature 200cm above ground", observation_data
+        )
+        result["hum"] = get_value_by_name(
+            "Relative Air Humidity 200cm above ground", observation_data
+        )
+        result["t_max"] = get_value_by_name(
+            "Maximum Air Temperature 200cm above ground", observation_data
+        )
+        result["t_min"] = get_value_by_name(
+            "Minimum Air Temperature 200cm above ground", observation_data
+        )
+        result["precipitation"] = get_value_by_name(
+            "Precipitation (incl. snow and hail)", observation_data
+        )
+        return result
+
+
+class GmlStationParser:
+    """Incrementally parse a weather GML document, keeping only the stations nearest to the locators.
+
+    Each featureMember is parsed once for all locators and discarded right
+    after, and its observation block is only materialized when the station is
+    nearer to a locator than every station seen before, so memory stays
+    bounded by one station per locator.
+    """
+
+    def __init__(self, locators):
+        self.nearest = [NearestStation(locator) for locator in locators]
+        # Set once the already known nearest stations of all locators have been found
+        self.done = False
+        self._parser = ET.XMLPullParser(events=("end",))
+
+    def feed(self, chunk):
+        self._parser.feed(chunk)
+        self._process_events()
+
+    def close(self):
+        """Finish parsing, returning the observation of the nearest station of each locator."""
+        if not self.done:
+            self._parser.close()
+            self._process_events()
+        for nearest in self.nearest:
+            if nearest.station is not None:
+                nearest.locator.pos = nearest.station
+        return [nearest.result() for nearest in self.nearest]
+
+    def _process_events(self):
+        for _, element in self._parser.read_events():
+            if self.done or element.tag != FEATURE_MEMBER:
+                continue
+            pos = parse_station_position(element)
+            if pos is not None:
+                for nearest in self.nearest:
+                    nearest.consider(pos, element)
+                self.done = all(nearest.done for nearest in self.nearest)
+            element.clear()
+
+
+class Location:
+    """A GPS location with its projected coordinates and nearest grid cells and station."""
+
+    def __init__(self, latitude, longitude):
+        self.latitude = latitude
+        self.longitude = longitude
+        (x_luref, y_luref), (x_etrs89, y_etrs89) = project_location(latitude, longitude)
+        _LOGGER.debug(
+            f"Our location: Lat = {round(latitude,2)}, Lon = {round(longitude,2)}. LUREF: X = {round(x_luref)}, Y = {round(y_luref)}. ETRS89: X = {round(x_etrs89)}, Y = {round(y_etrs89)}"
+        )
+        self.o3 = GridLocator(x_luref, y_luref, neighbours=GRID_NEIGHBOURS)
+        self.no2 = GridLocator(x_luref, y_luref, neighbours=GRID_NEIGHBOURS)
+        self.station = StationLocator(x_etrs89, y_etrs89)
+
+
+@lru_cache(maxsize=16)
+def get_location(latitude, longitude):
+    """Return the Location for GPS coordinates, projecting each location only once.
+
+    Blocking on first use (pyproj and NumPy imports and transformer setup), so run it in an executor.
+    """
+    # Warm up the transformer used for station coordinates and the grid searches as well
+    get_transformer(ETRS89, WGS84)
+    get_numpy()
+    return Location(latitude, longitude)
+
+
+async def async_get_location(hass, latitude, longitude):
+    """Return the Location for GPS coordinates without blocking the event loop."""
+    return await hass.async_add_executor_job(get_location, latitude, longitude)
+
+
+def parse_locations(text):
+    """Parse one "name: latitude, longitude" location per line into [(slug, name, latitude, longitude)].
+
+    Raises ValueError naming the first invalid line.
+    """
+    locations = []
+    slugs = {HOME_LOCATION}
+    for line in (text or "").splitlines():
+        if not line.strip():
+            continue
+        name, separator, coordinates = line.partition(":")
+        try:
+            if not separator or not name.strip():
+                raise ValueError
+            latitude, longitude = (float(value) for value in coordinates.split(","))
+        except ValueError:
+            raise ValueError(f"Invalid location: {line.strip()}") from None
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError(f"Invalid location: {line.strip()}")
+        slug = slugify(name.strip())
+        if slug in slugs:
+            raise ValueError(f"Duplicate location: {name.strip()}")
+        slugs.add(slug)
+        locations.append((slug, name.strip(), latitude, longitude))
+    return locations
+
+
+class EnvironmentCoordinator(DataUpdateCoordinator):
+    """Fetch O3, NO2 and weather observations for the Home Assistant location and any further locations.
+
+    The three sources are fetched concurrently, each with its own timeout and
+    retry budget, and each source is downloaded once and searched for all
+    locations in a single pass. A failed source keeps its last good values and
+    is listed in the "stale" entry of the data, so one slow source no longer
+    delays or invalidates the others.
+    """
+
+    def __init__(self, hass, entry, update_interval, locations=()):
+        self.entry = entry
+        self.session = async_get_clientsession(hass)
+        # Name of each location by slug, the Home Assistant location being unnamed
+        self.names = {HOME_LOCATION: None, **{slug: name for slug, name, _, _ in locations}}
+        self._coordinates = {slug: (latitude, longitude) for slug, _, latitude, longitude in locations}
+        self.locations = {}
+        self.addresses = {}
+        self.values = {"o3": {}, "no2": {}, "weather": {}}
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_environment",
+            update_interval=update_interval,
+        )
+
+    async def _async_update_data(self):
+        """Fetch all sources concurrently and publish partial results."""
+        await self._async_update_locations()
+        slugs = list(self.locations)
+        locations = [self.locations[slug] for slug in slugs]
+
+        sources = {
+            "o3": lambda: async_fetch_json_data(self.hass, self.session, API_O3, [location.o3 for location in locations]),
+            "no2": lambda: async_fetch_json_data(self.hass, self.session, API_NO2, [location.no2 for location in locations]),
+            "weather": lambda: async_fetch_gml_data(self.hass, self.session, API_GML, [location.station for location in locations]),
+        }
+        results = await asyncio.gather(
+            *(self._async_fetch_source(name, fetch) for name, fetch in sources.items()),
+            return_exceptions=True,
+        )
+
+        stale = []
+        for name, result in zip(sources, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(f"Error fetching {name}, keeping last values: {result}")
+                stale.append(name)
+            else:
+                self.values[name].update((slug, value) for slug, value in zip(slugs, result) if value)
+        if not any(self.values.values()):
+            raise UpdateFailed("Error fetching environmental data")
+        return {
+            "locations": {
+                slug: {
+                    "address": self.addresses.get(slug),
+                    **{name: values.get(slug) for name, values in self.values.items()},
+                }
+                for slug in slugs
+            },
+            "stale": stale,
+        }
+
+    async def _async_update_locations(self) -> None:
+        """Project the locations and look up their addresses, only when they change."""
+        coordinates = {HOME_LOCATION: get_home_location(self.hass), **self._coordinates}
+        changed = [
+            slug for slug, (latitude, longitude) in coordinates.items()
+            if slug not in self.locations or (self.locations[slug].latitude, self.locations[slug].longitude) != (latitude, longitude)
+        ]
+        if not changed:
+            return
+        for slug in changed:
+            self.locations[slug] = await async_get_location(self.hass, *coordinates[slug])
+        addresses = await self._async_get_addresses([coordinates[slug] for slug in changed])
+        for slug, address in zip(changed, addresses):
+            self.addresses[slug] = address
+            _LOGGER.debug(f"Environment location {slug} set to {coordinates[slug]} ({address})")
+
+    async def _async_get_addresses(self, coordinates):
+        """Return the addresses of locations from the shared geocoding cache, None where unknown."""
+        try:
+            return await async_get_geocoder(self.hass).async_reverse_many(coordinates)
+        except Exception as err:
+            _LOGGER.warning(f"Error looking up the addresses of the environment locations: {err}")
+            return [None for _ in coordinates]
+
+    async def _async_fetch_source(self, name, fetch):
+        """Fetch one source within its timeout, retrying with exponential backoff."""
+        for attempt in range(ENVIRONMENT_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(ENVIRONMENT_RETRY_DELAY * 2 ** (attempt - 1))
+            try:
+                async with asyncio.timeout(ENVIRONMENT_TIMEOUTS[name]):
+                    results = await fetch()
+                if any(results):
+                    return results
+                error = "no data"
+            except TimeoutError:
+                error = f"timed out after {ENVIRONMENT_TIMEOUTS[name]} seconds"
+            _LOGGER.debug(f"Error fetching {name} (attempt {attempt + 1}): {error}")
+        raise UpdateFailed(f"{name} {error}")
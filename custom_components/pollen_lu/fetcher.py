@@ -0,0 +1,306 @@
+from dataclasses import dataclass
+from typing import Any
+import asyncio
+import hashlib
+import logging
+import random
+import time
+
+import aiohttp
+from homeassistant.core import callback
+
+try:
+    # Several times faster than the json module on large payloads, and shipped with Home Assistant
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from .const import (
+    API_URL,
+    FETCH_MIN_AGE,
+    FETCH_TIMEOUT,
+    FETCH_RETRIES,
+    FETCH_RETRY_DELAY,
+    CIRCUIT_FAILURES,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_MAX_COOLDOWN,
+)
+from .metrics import EndpointMetrics, RequestTiming
+
+_LOGGER = logging.getLogger(__name__)
+
+HEADERS = {
+    "Host": "pollen-api.chl.lu",
+    "Accept": "*/*",
+    "Content-Type": "application/json",
+    "Sec-Fetch-Site": "cross-site",
+    "Origin": "capacitor://localhost",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Sec-Fetch-Mode": "cors",
+    "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 17_5_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Mobile/15E148",
+    "Accept-Language": "lb,en-GB;q=0.9,en;q=0.8",
+    "Sec-Fetch-Dest": "empty",
+    "Connection": "keep-alive",
+}
+
+
+@dataclass
+class FetchResult:
+    """Last known payload of an endpoint and its HTTP validators."""
+
+    data: Any
+    hash: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    # Monotonic time of the last response, None for a payload seeded from the cache
+    fetched: float | None = None
+
+
+class CircuitOpenError(Exception):
+    """An endpoint is not requested because it failed repeatedly."""
+
+
+class CircuitBreaker:
+    """Stop requesting an endpoint for a cooling period after consecutive failures.
+
+    Once the cooling period is over, a single failure opens the circuit
+    again with a doubled cooling period, and a success closes it.
+    """
+
+    def __init__(self, failures=CIRCUIT_FAILURES, cooldown=CIRCUIT_COOLDOWN, max_cooldown=CIRCUIT_MAX_COOLDOWN):
+        self.threshold = failures
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.threshold:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half_open"
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the endpoint may be requested again."""
+        return max(0.0, self.open_until - time.monotonic())
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.trips += 1
+            self.open_until = time.monotonic() + min(self.cooldown * 2 ** (self.trips - 1), self.max_cooldown)
+
+    def as_dict(self) -> dict:
+        return {"state": self.state, "failures": self.failures, "retry_in": round(self.retry_in)}
+
+
+class TokenBucket:
+    """Allow bursts of up to capacity actions, refilled with one token every interval seconds."""
+
+    def __init__(self, capacity, interval):
+        self.capacity = capacity
+        self.interval = interval
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+        self.updated = now
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until a token is available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) * self.interval)
+
+    def acquire(self) -> bool:
+        """Take a token, returning False if none is left."""
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+def is_transient(err) -> bool:
+    """Return whether a failed request is worth retrying right away."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status >= 500 or err.status == 429
+    return isinstance(err, (aiohttp.ClientConnectionError, TimeoutError))
+
+
+class SharedFetcher:
+    """Fetch pollen.lu API endpoints once on behalf of all config entries.
+
+    Concurrent requests for the same endpoint share a single in-flight
+    request, and results younger than min_age are served without a request.
+    Payloads are decoded with orjson when available and passed through the
+    endpoint's parser, if any, so only the parsed form is kept. Transient
+    errors are retried with jittered exponential backoff, and an endpoint
+    failing repeatedly is not requested while its circuit breaker is open.
+    """
+
+    def __init__(self, session, min_age=FETCH_MIN_AGE, parsers=None, base_url=API_URL):
+        self.session = session
+        self.base_url = base_url
+        self.min_age = min_age
+        self.parsers = parsers or {}
+        self.results = {}
+        self.stats = {
+            "requests": 0,
+            "coalesced": 0,
+            "fresh": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "parsed": 0,
+            "retries": 0,
+            "short_circuited": 0,
+        }
+        self.metrics = {}
+        self.breakers = {}
+        self._inflight = {}
+        self._listeners = {}
+
+    def seed(self, endpoint, data, validators) -> None:
+        """Provide a cached payload for an endpoint that has not been fetched yet."""
+        if endpoint in self.results:
+            return
+        self.results[endpoint] = FetchResult(
+            data,
+            validators.get("hash"),
+            validators.get("etag"),
+            validators.get("last_modified"),
+        )
+
+    def validators(self, endpoint) -> dict:
+        """Return the HTTP validators of an endpoint, for persisting."""
+        result = self.results.get(endpoint)
+        if result is None:
+            return {}
+        return {"hash": result.hash, "etag": result.etag, "last_modified": result.last_modified}
+
+    @callback
+    def async_add_listener(self, endpoint, update_callback):
+        """Call update_callback with every new payload of endpoint, returning a function to remove it."""
+        listeners = self._listeners.setdefault(endpoint, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def async_fetch(self, endpoint) -> FetchResult:
+        """Return the latest payload of an endpoint, sharing requests between callers."""
+        result = self.results.get(endpoint)
+        if result is not None and result.data is not None and result.fetched is not None and time.monotonic() - result.fetched < self.min_age:
+            self.stats["fresh"] += 1
+            return result
+
+        task = self._inflight.get(endpoint)
+        breaker = self.breakers.setdefault(endpoint, CircuitBreaker())
+        if task is None and not breaker.allow():
+            self.stats["short_circuited"] += 1
+            raise CircuitOpenError(f"{endpoint} failed {breaker.failures} times, not requested for another {breaker.retry_in:.0f} seconds")
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._async_request(endpoint))
+            self._inflight[endpoint] = task
+            task.add_done_callback(lambda _: self._inflight.pop(endpoint, None))
+        else:
+            self.stats["coalesced"] += 1
+        # Shield the shared request so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _async_request(self, endpoint) -> FetchResult:
+        """Request an endpoint, retrying transient errors, and update its circuit breaker."""
+        breaker = self.breakers.setdefault(endpoint, CircuitBreaker())
+        for attempt in range(FETCH_RETRIES + 1):
+            if attempt:
+                self.stats["retries"] += 1
+                # Full jitter keeps the instances of several users from retrying in step
+                await asyncio.sleep(random.uniform(0, FETCH_RETRY_DELAY * 2 ** (attempt - 1)))
+            try:
+                async with asyncio.timeout(FETCH_TIMEOUT):
+                    result, changed = await self._async_request_once(endpoint)
+            except Exception as err:
+                self.metrics.setdefault(endpoint, EndpointMetrics()).record_error(err)
+                if attempt < FETCH_RETRIES and is_transient(err):
+                    _LOGGER.debug(f"Error fetching {endpoint} (attempt {attempt + 1}), retrying: {err!r}")
+                    continue
+                breaker.record_failure()
+                if breaker.state == "open":
+                    _LOGGER.warning(f"{endpoint} failed {breaker.failures} times, not requesting it for {breaker.retry_in:.0f} seconds")
+                raise
+            breaker.record_success()
+            # Outside of the retries, so a failing listener does not count as a failed request
+            if changed:
+                self._notify_listeners(endpoint, result)
+            return result
+
+    def _notify_listeners(self, endpoint, result) -> None:
+        """Hand a changed payload to every listener, one failing listener not keeping it from the others."""
+        listeners = list(self._listeners.get(endpoint, []))
+        _LOGGER.debug(f"{endpoint} changed, notifying {len(listeners)} listeners")
+        start = time.perf_counter()
+        for update_callback in listeners:
+            try:
+                update_callback(result)
+            except Exception:
+                _LOGGER.exception(f"Error handling the new {endpoint} payload")
+        self.metrics.setdefault(endpoint, EndpointMetrics()).fan_out = round((time.perf_counter() - start) * 1000, 1)
+
+    async def _async_request_once(self, endpoint):
+        """Conditionally request an endpoint and parse its body if it changed, returning the result and whether it changed."""
+        result = self.results.get(endpoint)
+        headers = dict(HEADERS)
+        if result is not None and result.etag:
+            headers["If-None-Match"] = result.etag
+        if result is not None and result.last_modified:
+            headers["If-Modified-Since"] = result.last_modified
+
+        self.stats["requests"] += 1
+        metrics = self.metrics.setdefault(endpoint, EndpointMetrics())
+        metrics.requests += 1
+        timing = RequestTiming()
+        async with self.session.get(f"{self.base_url}/{endpoint}", headers=headers, trace_request_ctx=timing) as response:
+            if response.status == 304 and result is not None:
+                metrics.record_response(timing, 0, 0)
+                self.stats["not_modified"] += 1
+                result.fetched = time.monotonic()
+                return result, False
+            response.raise_for_status()
+            body = await response.read()
+            metrics.record_response(timing, response.content_length, len(body))
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        digest = hashlib.sha256(body).hexdigest()
+        if result is not None and digest == result.hash:
+            self.stats["unchanged"] += 1
+            result.etag = etag
+            result.last_modified = last_modified
+            result.fetched = time.monotonic()
+            return result, False
+
+        start = time.perf_counter()
+        data = json_loads(body)["data"]
+        if endpoint in self.parsers:
+            data = self.parsers[endpoint](data)
+        metrics.parse = round((time.perf_counter() - start) * 1000, 1)
+
+        result = FetchResult(data, digest, etag, last_modified, time.monotonic())
+        self.results[endpoint] = result
+        self.stats["parsed"] += 1
+        return result, True
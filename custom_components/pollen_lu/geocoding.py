@@ -0,0 +1,183 @@
+from collections import OrderedDict
+import asyncio
+import logging
+import re
+import time
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    GEOCODER,
+    GEOPORTAIL_URL,
+    GEOCODE_STORAGE_KEY,
+    GEOCODE_STORAGE_VERSION,
+    GEOCODE_CACHE_SIZE,
+    GEOCODE_TTL,
+    GEOCODE_MISS_TTL,
+    GEOCODE_CONCURRENCY,
+    GEOCODE_PRECISION,
+    STORAGE_SAVE_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_get_address_from_gps(session, latitude, longitude, base_url=GEOPORTAIL_URL):
+    """Return the address nearest to GPS coordinates, or None."""
+    url = f"{base_url}/reverse"
+    async with session.get(url, params={"lat": latitude, "lon": longitude}) as response:
+        if response.status != 200:
+            _LOGGER.warning(f"Reverse geocoding request failed with status code: {response.status}")
+            return None
+        data = await response.json()
+
+    results = data.get("results") or []
+    if not results:
+        _LOGGER.warning("No address found for the given coordinates.")
+        return None
+    return results[0].get("address") or results[0].get("name")
+
+
+async def async_get_gps_from_address(session, params, base_url=GEOPORTAIL_URL):
+    """Return the (latitude, longitude) of an address given as zip, locality, street, num and country, or None."""
+    url = f"{base_url}/search"
+    async with session.get(url, params=params) as response:
+        if response.status != 200:
+            _LOGGER.warning(f"Geocoding request failed with status code: {response.status}")
+            return None
+        data = await response.json()
+
+    if "results" in data and len(data["results"]) > 0:
+        first_result = data["results"][0]
+        # Extract the coordinates from the 'geomlonlat' field
+        if (
+            "geomlonlat" in first_result
+            and "coordinates" in first_result["geomlonlat"]
+        ):
+            coordinates = first_result["geomlonlat"]["coordinates"]
+            lon, lat = coordinates[0], coordinates[1]
+            return lat, lon
+        _LOGGER.warning("'geomlonlat' data is missing in the result.")
+        return None
+    _LOGGER.warning("No results found for the given address.")
+    return None
+
+
+def normalize_address(params):
+    """Return the search parameters of an address with empty fields dropped and case and spacing normalized."""
+    normalized = {}
+    for key, value in params.items():
+        value = re.sub(r"\s+", " ", str(value)).strip().casefold()
+        if value:
+            normalized[key] = value
+    return dict(sorted(normalized.items()))
+
+
+def address_key(params):
+    return "search:" + "|".join(f"{key}={value}" for key, value in normalize_address(params).items())
+
+
+def coordinates_key(latitude, longitude):
+    # Four decimals are about 10 m, well below the resolution of the grids and stations
+    return f"reverse:{round(latitude, GEOCODE_PRECISION)},{round(longitude, GEOCODE_PRECISION)}"
+
+
+class Geocoder:
+    """Geocode with geoportail.lu through a persistent LRU cache with expiry.
+
+    Lookups of the same key share one request, and batches of lookups are
+    requested concurrently up to a limit. Misses are cached for a shorter time.
+    """
+
+    def __init__(self, hass, session, base_url=GEOPORTAIL_URL, size=GEOCODE_CACHE_SIZE):
+        self.session = session
+        self.base_url = base_url
+        self.size = size
+        self.stats = {"hits": 0, "misses": 0, "requests": 0}
+        # key -> (value, expiry as seconds since the epoch), least recently used first
+        self._cache = OrderedDict()
+        self._store = Store(hass, GEOCODE_STORAGE_VERSION, GEOCODE_STORAGE_KEY)
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._inflight = {}
+        self._semaphore = asyncio.Semaphore(GEOCODE_CONCURRENCY)
+
+    async def _async_ensure_loaded(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+            data = await self._store.async_load() or {}
+            now = time.time()
+            for key, value, expires in data.get("entries", []):
+                if expires > now:
+                    self._cache[key] = (tuple(value) if isinstance(value, list) else value, expires)
+            self._loaded = True
+
+    async def async_save(self) -> None:
+        """Write the cache now, replacing a pending delayed save, if it was ever loaded."""
+        if self._loaded:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        now = time.time()
+        return {"entries": [[key, value, expires] for key, (value, expires) in self._cache.items() if expires > now]}
+
+    async def _async_lookup(self, key, request):
+        """Return the cached value of key, or request and cache it."""
+        await self._async_ensure_loaded()
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > time.time():
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            return cached[0]
+        self.stats["misses"] += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._async_request(key, request))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_request(self, key, request):
+        async with self._semaphore:
+            self.stats["requests"] += 1
+            value = await request()
+        ttl = GEOCODE_TTL if value is not None else GEOCODE_MISS_TTL
+        self._cache[key] = (value, time.time() + ttl.total_seconds())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.size:
+            self._cache.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+        return value
+
+    async def async_search(self, params):
+        """Return the (latitude, longitude) of an address, or None."""
+        params = normalize_address(params)
+        return await self._async_lookup(
+            address_key(params),
+            lambda: async_get_gps_from_address(self.session, params, self.base_url),
+        )
+
+    async def async_reverse(self, latitude, longitude):
+        """Return the address nearest to GPS coordinates, or None."""
+        return await self._async_lookup(
+            coordinates_key(latitude, longitude),
+            lambda: async_get_address_from_gps(self.session, latitude, longitude, self.base_url),
+        )
+
+    async def async_search_many(self, addresses):
+        """Geocode several addresses concurrently, returning their coordinates in order."""
+        return await asyncio.gather(*(self.async_search(params) for params in addresses))
+
+    async def async_reverse_many(self, coordinates):
+        """Reverse geocode several (latitude, longitude) pairs concurrently, returning their addresses in order."""
+        return await asyncio.gather(*(self.async_reverse(latitude, longitude) for latitude, longitude in coordinates))
+
+
+def async_get_geocoder(hass):
+    """Return the Geocoder shared by all config entries."""
+    if GEOCODER not in hass.data:
+        hass.data[GEOCODER] = Geocoder(hass, async_get_clientsession(hass))
+    return hass.data[GEOCODER]
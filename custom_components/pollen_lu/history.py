@@ -0,0 +1,194 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from itertools import chain
+import logging
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    HISTORY_STORAGE_KEY,
+    HISTORY_STORAGE_VERSION,
+    HISTORY_RAW_RETENTION,
+    HISTORY_DAILY_RETENTION,
+    STORAGE_SAVE_DELAY,
+)
+from .scheduler import parse_measurement_date
+from .trend import PollenTrend
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PollenSeries:
+    """Append-only time series of one pollen type.
+
+    Recent samples are kept as (timestamp, value) arrays. Samples older than
+    the raw retention are downsampled to one (day, max, sum, count) row per
+    day, which is kept for the daily retention. The timestamp of the last
+    sample is kept apart, since it may already be downsampled.
+    """
+
+    __slots__ = ("times", "values", "days", "daily_max", "daily_sum", "daily_count", "high_threshold", "last_time")
+
+    def __init__(self):
+        self.times = array("d")
+        self.values = array("d")
+        self.days = array("l")
+        self.daily_max = array("d")
+        self.daily_sum = array("d")
+        self.daily_count = array("l")
+        self.high_threshold = None
+        self.last_time = None
+
+    def append(self, timestamp, value) -> bool:
+        """Append a sample, returning False if it is not newer than the last one."""
+        if self.last_time is not None and timestamp <= self.last_time:
+            return False
+        self.last_time = timestamp
+        self.times.append(timestamp)
+        self.values.append(value)
+        return True
+
+    def compact(self, now) -> None:
+        """Downsample samples older than the raw retention and drop expired days."""
+        cutoff = bisect_left(self.times, (now - HISTORY_RAW_RETENTION).timestamp())
+        for timestamp, value in zip(self.times[:cutoff], self.values[:cutoff]):
+            day = datetime.fromtimestamp(timestamp).toordinal()
+            if self.days and self.days[-1] == day:
+                self.daily_max[-1] = max(self.daily_max[-1], value)
+                self.daily_sum[-1] += value
+                self.daily_count[-1] += 1
+            else:
+                self.days.append(day)
+                self.daily_max.append(value)
+                self.daily_sum.append(value)
+                self.daily_count.append(1)
+        del self.times[:cutoff]
+        del self.values[:cutoff]
+
+        expired = bisect_left(self.days, (now - HISTORY_DAILY_RETENTION).toordinal())
+        for column in (self.days, self.daily_max, self.daily_sum, self.daily_count):
+            del column[:expired]
+
+    def statistics(self, start, end) -> dict:
+        """Return max, mean, sample count and days above the high threshold between two datetimes."""
+        first_day = bisect_left(self.days, start.toordinal())
+        last_day = bisect_right(self.days, end.toordinal())
+        first = bisect_left(self.times, start.timestamp())
+        last = bisect_right(self.times, end.timestamp())
+
+        values = self.values[first:last]
+        count = len(values) + sum(self.daily_count[first_day:last_day])
+        total = sum(values) + sum(self.daily_sum[first_day:last_day])
+        maximum = max(chain(values, self.daily_max[first_day:last_day]), default=None)
+
+        days_above_high = None
+        if self.high_threshold is not None:
+            high_days = {
+                day for day, day_max in zip(self.days[first_day:last_day], self.daily_max[first_day:last_day])
+                if day_max >= self.high_threshold
+            }
+            high_days |= {
+                datetime.fromtimestamp(timestamp).toordinal()
+                for timestamp, value in zip(self.times[first:last], values)
+                if value >= self.high_threshold
+            }
+            days_above_high = len(high_days)
+
+        return {
+            "samples": count,
+            "max": maximum,
+            "mean": round(total / count, 2) if count else None,
+            "days_above_high": days_above_high,
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "times": self.times.tolist(),
+            "values": self.values.tolist(),
+            "days": self.days.tolist(),
+            "daily_max": self.daily_max.tolist(),
+            "daily_sum": self.daily_sum.tolist(),
+            "daily_count": self.daily_count.tolist(),
+            "high_threshold": self.high_threshold,
+            "last_time": self.last_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        series = cls()
+        series.times = array("d", data.get("times", []))
+        series.values = array("d", data.get("values", []))
+        series.days = array("l", data.get("days", []))
+        series.daily_max = array("d", data.get("daily_max", []))
+        series.daily_sum = array("d", data.get("daily_sum", []))
+        series.daily_count = array("l", data.get("daily_count", []))
+        series.high_threshold = data.get("high_threshold")
+        series.last_time = data.get("last_time")
+        if series.last_time is None and series.times:
+            series.last_time = series.times[-1]
+        elif series.last_time is None and series.days:
+            # Histories saved without it: the last sample was on the last downsampled day
+            series.last_time = datetime.combine(date.fromordinal(series.days[-1] + 1), datetime.min.time()).timestamp() - 1
+        return series
+
+
+class PollenHistory:
+    """Compact history of every pollen type, shared by all config entries."""
+
+    def __init__(self, hass):
+        self.series = {}
+        self.trends = {}
+        self._store = Store(hass, HISTORY_STORAGE_VERSION, HISTORY_STORAGE_KEY)
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load() or {}
+        self.series = {key: PollenSeries.from_dict(series) for key, series in data.items()}
+        # Trends are updated per sample afterwards, so the history is only read back once
+        self.trends = {}
+        for key, series in self.series.items():
+            trend = self.trends[key] = PollenTrend()
+            for timestamp, value in zip(series.times[-trend.samples.maxlen:], series.values[-trend.samples.maxlen:]):
+                trend.add(timestamp, value)
+        _LOGGER.debug(f"History loaded for {len(self.series)} pollen types")
+
+    @callback
+    def async_handle_pollens(self, result) -> None:
+        """Record the samples of a new /pollens payload."""
+        now = datetime.now().astimezone()
+        added = 0
+        for record in result.data:
+            measured = parse_measurement_date(record.last_update)
+            if measured is None or record.value is None:
+                continue
+            series = self.series.setdefault(record.key, PollenSeries())
+            series.high_threshold = record.high_threshold
+            if series.append(measured.timestamp(), record.value):
+                series.compact(now)
+                self.trends.setdefault(record.key, PollenTrend()).add(measured.timestamp(), record.value)
+                added += 1
+        if added:
+            _LOGGER.debug(f"Recorded {added} pollen samples")
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the history now, replacing a pending delayed save."""
+        await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict:
+        return {key: series.as_dict() for key, series in self.series.items()}
+
+    def statistics(self, keys=None, days=7, now=None) -> dict:
+        """Return statistics over the last days and the season (since January 1st) per pollen type."""
+        now = now or datetime.now().astimezone()
+        start = now - timedelta(days=days)
+        season_start = datetime.combine(date(now.year, 1, 1), datetime.min.time()).astimezone()
+        return {
+            key: {
+                **series.statistics(start, now),
+                "season_max": series.statistics(season_start, now)["max"],
+            }
+            for key, series in self.series.items()
+            if not keys or key in keys
+        }
@@ -0,0 +1,85 @@
+from dataclasses import asdict, dataclass, field
+import time
+
+import aiohttp
+
+# Trace events marking the phases of a request, by the name of their timestamp
+TRACE_EVENTS = {
+    "on_dns_resolvehost_start": "dns_start",
+    "on_dns_resolvehost_end": "dns_end",
+    "on_connection_create_start": "connect_start",
+    "on_connection_create_end": "connect_end",
+    "on_request_end": "headers",
+}
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """Timestamps of one request, filled in by the trace config."""
+
+    start: float = field(default_factory=time.perf_counter)
+    marks: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        self.marks["start"] = self.start
+
+    def elapsed(self, since, until):
+        """Return the milliseconds between two marks, or None if either did not happen."""
+        if since not in self.marks or until not in self.marks:
+            return None
+        return round((self.marks[until] - self.marks[since]) * 1000, 1)
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """Timings, sizes and errors of the last request of an API endpoint, all durations in milliseconds.
+
+    DNS and connect are None when the request reused a pooled connection.
+    """
+
+    requests: int = 0
+    errors: int = 0
+    last_error: str | None = None
+    dns: float | None = None
+    connect: float | None = None
+    ttfb: float | None = None
+    total: float | None = None
+    compressed_bytes: int | None = None
+    bytes: int | None = None
+    parse: float | None = None
+    fan_out: float | None = None
+
+    def record_response(self, timing, compressed_bytes, size) -> None:
+        """Record a response whose body was read."""
+        self.dns = timing.elapsed("dns_start", "dns_end")
+        connect = timing.elapsed("connect_start", "connect_end")
+        # The connection phase includes the DNS lookup
+        self.connect = round(connect - (self.dns or 0), 1) if connect is not None else None
+        self.ttfb = timing.elapsed("start", "headers")
+        self.total = round((time.perf_counter() - timing.start) * 1000, 1)
+        self.compressed_bytes = compressed_bytes
+        self.bytes = size
+
+    def record_error(self, err) -> None:
+        self.errors += 1
+        self.last_error = f"{type(err).__name__}: {err}"
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def create_trace_config():
+    """Return an aiohttp trace config recording the phases of requests made with a RequestTiming context."""
+    trace_config = aiohttp.TraceConfig()
+    for event, mark in TRACE_EVENTS.items():
+        getattr(trace_config, event).append(_marker(mark))
+    return trace_config
+
+
+def _marker(mark):
+    async def on_event(session, trace_config_ctx, params):
+        timing = trace_config_ctx.trace_request_ctx
+        if isinstance(timing, RequestTiming):
+            timing.marks[mark] = time.perf_counter()
+
+    return on_event
@@ -0,0 +1,73 @@
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class PollenRecord:
+    """What a PollenSensor shows for one pollen type, parsed once per payload."""
+
+    key: str
+    id: int | None
+    value: float | None
+    state: int
+    level: str
+    last_update: str | None
+    picture: str
+    description_key: str | None
+    moderate_threshold: int | None
+    high_threshold: int | None
+
+    @classmethod
+    def from_api(cls, item):
+        """Build a record from a /pollens API item."""
+        level = item.get("level", "")
+        value = item.get("value")
+        thresholds = {
+            threshold.get("type"): threshold.get("min", 999)
+            for threshold in item.get("threshold") or []
+        }
+        pictures = item.get("pictures") or [{}]
+        descriptions = item.get("descriptions") or [None]
+        return cls(
+            key=item.get("translationKey"),
+            id=item.get("id"),
+            value=value,
+            state=round(value) if level != "undetected" and value is not None else 0,
+            level=level,
+            last_update=item.get("lastMeasurementDate"),
+            picture=pictures[0].get("path", ""),
+            description_key=descriptions[0],
+            moderate_threshold=thresholds.get("medium", 999) if thresholds else None,
+            high_threshold=thresholds.get("high", 999) if thresholds else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from its persisted form."""
+        return cls(**data)
+
+    def as_dict(self):
+        """Return the record in a JSON serializable form."""
+        return asdict(self)
+
+
+def parse_pollens(data):
+    """Parse the active pollens of a /pollens payload into a tuple of records."""
+    return tuple(PollenRecord.from_api(item) for item in data if item.get("active"))
+
+
+def project_translations(data):
+    """Keep only the locale and content of the pollen translations of a /translations payload."""
+    return [
+        {
+            "domain": item["domain"],
+            "key": item.get("key"),
+            "translations": [
+                {"locale": translation.get("locale"), "content": translation["content"]}
+                for translation in item.get("translations") or []
+                if translation.get("content")
+            ],
+        }
+        # The sensors only translate keys of the pollen domain
+        for item in data
+        if item.get("domain") == "pollen"
+    ]
@@ -0,0 +1,79 @@
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+
+from .const import PROFILING_REFRESHES
+
+
+@dataclass(slots=True)
+class RenderStats:
+    """Times (milliseconds) one entity took to render and write its state."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    last: float = 0.0
+
+    def record(self, duration) -> None:
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.last = duration
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            "last": round(self.last, 3),
+        }
+
+
+class RenderProfiler:
+    """Record the render time of each pollen sensor and the event loop time of each refresh.
+
+    A refresh occupies the event loop while parsing a new payload and while
+    notifying the listeners, which render and write the changed sensors.
+    Only enabled in profiling mode, since timing every write costs time itself.
+    """
+
+    def __init__(self, size=PROFILING_REFRESHES):
+        self.entities = {}
+        self.refreshes = deque(maxlen=size)
+        self._parse = None
+        self._rendered = 0
+        self._render_time = 0.0
+
+    def record_parse(self, duration) -> None:
+        """Record the parse time (milliseconds) of the payload about to be fanned out."""
+        self._parse = duration
+
+    def record_render(self, entity_id, duration) -> None:
+        """Record the time (milliseconds) an entity took to render and write its state."""
+        self.entities.setdefault(entity_id, RenderStats()).record(duration)
+        self._rendered += 1
+        self._render_time += duration
+
+    def record_refresh(self, fan_out) -> dict:
+        """Close the current refresh, given the duration (milliseconds) of its listener notification."""
+        refresh = {
+            "time": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "parse": self._parse,
+            "fan_out": round(fan_out, 3),
+            "rendered": self._rendered,
+            "render": round(self._render_time, 3),
+            "occupancy": round((self._parse or 0) + fan_out, 3),
+        }
+        self.refreshes.append(refresh)
+        self._parse = None
+        self._rendered = 0
+        self._render_time = 0.0
+        return refresh
+
+    def as_dict(self) -> dict:
+        """Return the refreshes, latest last, and the render statistics of each entity, slowest first."""
+        entities = sorted(self.entities.items(), key=lambda item: item[1].total / item[1].count, reverse=True)
+        return {
+            "refreshes": list(self.refreshes),
+            "entities": {entity_id: stats.as_dict() for entity_id, stats in entities},
+        }
@@ -0,0 +1,87 @@
+from collections import deque
+from datetime import datetime, timedelta
+from statistics import median
+import random
+
+MEASUREMENT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_measurement_date(value):
+    """Parse a lastMeasurementDate string as a local, timezone-aware datetime."""
+    try:
+        return datetime.strptime(value, MEASUREMENT_FORMAT).astimezone()
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveScheduler:
+    """Learn the upstream publication cadence and choose when to poll next.
+
+    Between publications the scheduler sleeps until shortly before the next
+    expected one, then polls densely, backing off exponentially while the new
+    measurement is overdue. It never waits longer than max_interval.
+    """
+
+    def __init__(
+        self,
+        default_cadence=timedelta(hours=3),
+        window=timedelta(minutes=15),
+        min_interval=timedelta(minutes=5),
+        max_interval=timedelta(hours=1),
+        history=8,
+        jitter=0.1,
+        rng=None,
+    ):
+        self.default_cadence = default_cadence
+        self.window = window
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.last_measurement = None
+        self.misses = 0
+        self._intervals = deque(maxlen=history)
+        self._rng = rng or random.Random()
+
+    @property
+    def cadence(self):
+        """Median interval between observed publications."""
+        if not self._intervals:
+            return self.default_cadence
+        return median(self._intervals)
+
+    @property
+    def expected_update(self):
+        """When the next publication is expected, or None before the first observation."""
+        if self.last_measurement is None:
+            return None
+        return self.last_measurement + self.cadence
+
+    def observe(self, measurement):
+        """Record the latest measurement date, returning True if it is a new publication."""
+        if measurement is None or (self.last_measurement is not None and measurement <= self.last_measurement):
+            return False
+        if self.last_measurement is not None:
+            self._intervals.append(measurement - self.last_measurement)
+        self.last_measurement = measurement
+        self.misses = 0
+        return True
+
+    def next_interval(self, now):
+        """Return how long to wait before the next poll."""
+        expected = self.expected_update
+        if expected is None:
+            interval = self.max_interval * (1 - self._rng.uniform(0, self.jitter))
+        elif now < expected - self.window:
+            # Sleep through the quiet period, waking early rather than late
+            interval = (expected - self.window - now) * (1 - self._rng.uniform(0, self.jitter))
+        elif now < expected:
+            # Inside the window: poll densely
+            interval = self.min_interval * (1 + self._rng.uniform(0, self.jitter))
+        else:
+            # Overdue: back off exponentially while nothing new arrives
+            interval = self.min_interval * 2 ** self.misses
+            if interval < self.max_interval:
+                # Stop counting once the backoff reaches max_interval, keeping the exponent small
+                self.misses += 1
+            interval = min(interval, self.max_interval) * (1 - self._rng.uniform(0, self.jitter))
+        return min(max(interval, self.min_interval), self.max_interval)
@@ -1,48 +1,81 @@
-import asyncio
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import CONCENTRATION_MICROGRAMS_PER_CUBIC_METER, PERCENTAGE, EntityCategory, UnitOfPrecipitationDepth, UnitOfTemperature, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import logging
-from .const import DOMAIN
+import time
+from .const import DOMAIN, HOME_LOCATION
+from .scheduler import parse_measurement_date
 
 _LOGGER = logging.getLogger(__name__)
 
+# (source, field, name, unit, device class) of the environmental sensors
+ENVIRONMENT_SENSORS = [
+    ("o3", "value", "Ozone", CONCENTRATION_MICROGRAMS_PER_CUBIC_METER, SensorDeviceClass.OZONE),
+    ("no2", "value", "Nitrogen dioxide", CONCENTRATION_MICROGRAMS_PER_CUBIC_METER, SensorDeviceClass.NITROGEN_DIOXIDE),
+    ("weather", "temp", "Temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    ("weather", "t_min", "Minimum temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    ("weather", "t_max", "Maximum temperature", UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE),
+    ("weather", "hum", "Humidity", PERCENTAGE, SensorDeviceClass.HUMIDITY),
+    ("weather", "precipitation", "Precipitation", UnitOfPrecipitationDepth.MILLIMETERS, SensorDeviceClass.PRECIPITATION),
+]
+
 async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the sensor platform."""
     _LOGGER.debug("async_setup_entry()")
     coordinator = hass.data[DOMAIN][entry.entry_id]
     # Wait for the initial data fetching to complete
-    while coordinator.pollen is None or coordinator.translations is None:
-        await asyncio.sleep(1) 
-    sensors = []
-    for pollen in coordinator.pollen:
-        if pollen["active"]:
-            sensors.append(PollenSensor(coordinator, pollen))
-    async_add_entities(sensors)
+    try:
+        await coordinator.async_wait_ready()
+    except TimeoutError as err:
+        _LOGGER.error(f"Pollen data not available: {err}")
+        raise PlatformNotReady(str(err)) from err
+
+    async_add_entities([PollStatusSensor(coordinator)])
+    async_add_entities(FetchMetricsSensor(coordinator, endpoint) for endpoint in ("pollens", "translations"))
+    if coordinator.environment is not None:
+        async_add_entities(
+            EnvironmentSensor(coordinator.environment, location, *description)
+            for location in coordinator.environment.names
+            for description in ENVIRONMENT_SENSORS
+        )
+
+    known = set()
+
+    @callback
+    def async_add_new_sensors():
+        """Add a sensor for every active pollen not seen before."""
+        sensors = []
+        for key, record in coordinator.pollen_by_key.items():
+            if key not in known:
+                known.add(key)
+                sensors.append(PollenSensor(coordinator, record))
+        if sensors:
+            _LOGGER.debug(f"Adding {len(sensors)} pollen sensors")
+            async_add_entities(sensors)
+
+    async_add_new_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(async_add_new_sensors))
 
 class PollenSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
     
-    def __init__(self, coordinator, pollen):
+    def __init__(self, coordinator, record):
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self.entity_type = pollen.get("translationKey")
-        self._attr_unique_id = f"{pollen.get("id")}_{self.entity_type}"
+        self.entity_type = record.key
+        self._attr_unique_id = f"{record.id}_{self.entity_type}"
         self.entity_id = f"sensor.pollen_{self.entity_type}"
         self._attr_native_unit_of_measurement = "p/m³"
         self._attr_icon = "mdi:flower-pollen"
         self._attr_device_class = None
-        self._attr_entity_picture = pollen.get("pictures", [])[0].get("path", "")
+        self._attr_entity_picture = record.picture
         self._attr_extra_state_attributes = {}
 
     def translate(self, key, domain):
-        language = self.hass.config.language
-        translations = next((item for item in self.coordinator.translations if item["key"] == key and item["domain"] == domain), None)
-        if translations:
-            translation = next((item for item in translations.get("translations") if item["locale"] == language), None)
-        if translation:
-            return translation.get("content")
-        else:
-            return key
+        """Translate a key to the Home Assistant system language."""
+        return self.coordinator.translate(key, domain)
 
     @property
     def name(self):
@@ -52,14 +85,9 @@ class PollenSensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        pollen = next((item for item in self.coordinator.pollen if item["translationKey"] == self.entity_type and item["active"]), None)
-        if pollen is not None:
-            level = pollen.get("level","")
-            if level != "undetected":
-                value = round(pollen.get("value"))
-            else:
-                value = 0
-            return value
+        record = self.coordinator.pollen_by_key.get(self.entity_type)
+        if record is not None:
+            return record.state
         else:
             return -1
 
@@ -67,20 +95,153 @@ class PollenSensor(CoordinatorEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         attributes = {}
-        pollen = next((item for item in self.coordinator.pollen if item["translationKey"] == self.entity_type and item["active"]), None)
-        thresholds = pollen.get("threshold", None)
-        attributes["level"] = pollen.get("level","")
-        attributes["last_update"] = pollen.get("lastMeasurementDate")
-        attributes["last_poll"] = self.coordinator.last_poll
-        attributes["next_poll"] = self.coordinator.next_poll
-        attributes["description"] = self.translate(pollen.get("descriptions", [])[0],"pollen")
-        if thresholds:
-            medium = next((item for item in thresholds if item["type"] == "medium"), None)
-            high = next((item for item in thresholds if item["type"] == "high"), None)
-            attributes["moderate_threshold"] = medium.get("min", 999)
-            attributes["high_threshold"] = high.get("min", 999)
+        record = self.coordinator.pollen_by_key.get(self.entity_type)
+        if record is None:
+            return attributes
+        attributes["level"] = record.level
+        attributes["last_update"] = record.last_update
+        attributes["description"] = self.translate(record.description_key, "pollen")
+        if record.moderate_threshold is not None:
+            attributes["moderate_threshold"] = record.moderate_threshold
+            attributes["high_threshold"] = record.high_threshold
+        attributes["stale"] = self.coordinator.stale
+        trend = self.coordinator.history.trends.get(self.entity_type) if self.coordinator.history else None
+        if trend is not None:
+            attributes.update(trend.attributes())
         return attributes
 
+    @callback
+    def _handle_coordinator_update(self):
+        """Write the state only if this pollen changed."""
+        if self.entity_type in self.coordinator.changed_keys:
+            profiler = self.coordinator.profiler
+            if profiler is None:
+                self.async_write_ha_state()
+                return
+            start = time.perf_counter()
+            self.async_write_ha_state()
+            profiler.record_render(self.entity_id, (time.perf_counter() - start) * 1000)
+
     async def async_update(self):
         """Update the sensor."""
         await self.coordinator.async_request_refresh()
+
+
+class PollStatusSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:cloud-download-outline"
+    _attr_name = "Pollen last poll"
+
+    def __init__(self, coordinator):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_last_poll"
+        self.entity_id = "sensor.pollen_last_poll"
+
+    async def async_added_to_hass(self):
+        """Write the state after every poll."""
+        self.async_on_remove(self.coordinator.async_add_poll_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self):
+        """Return when the API was last polled."""
+        return parse_measurement_date(self.coordinator.last_poll)
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        attributes = {
+            "success": self.coordinator.poll_success,
+            "next_poll": self.coordinator.next_poll,
+        }
+        if self.coordinator.expected_update:
+            attributes["expected_update"] = self.coordinator.expected_update
+        return attributes
+
+
+class FetchMetricsSensor(SensorEntity):
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, endpoint):
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.endpoint = endpoint
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_fetch_{endpoint}"
+        self.entity_id = f"sensor.pollen_api_{endpoint}"
+        self._attr_name = f"Pollen API {endpoint}"
+
+    async def async_added_to_hass(self):
+        """Write the state after every poll."""
+        self.async_on_remove(self.coordinator.async_add_poll_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self):
+        """Return the total duration of the last request."""
+        metrics = self.coordinator.fetcher.metrics.get(self.endpoint)
+        return metrics.total if metrics is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        metrics = self.coordinator.fetcher.metrics.get(self.endpoint)
+        attributes = {key: value for key, value in metrics.as_dict().items() if key != "total"} if metrics is not None else {}
+        if self.endpoint == "pollens" and self.coordinator.fan_out is not None:
+            attributes["sensor_fan_out"] = self.coordinator.fan_out["duration"]
+        return attributes
+
+
+class EnvironmentSensor(CoordinatorEntity, SensorEntity):
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, location, source, field, name, unit, device_class):
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.location = location
+        self.source = source
+        self.field = field
+        key = f"{source}_{field}" if source == "weather" else source
+        if location != HOME_LOCATION:
+            # The Home Assistant location keeps the entity IDs it had before further locations were supported
+            key = f"{location}_{key}"
+            name = f"{coordinator.names[location]} {name[0].lower()}{name[1:]}"
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_environment_{key}"
+        self.entity_id = f"sensor.environment_{key}"
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+
+    @property
+    def _location_data(self):
+        return ((self.coordinator.data or {}).get("locations") or {}).get(self.location) or {}
+
+    @property
+    def native_value(self):
+        """Return the value of the sensor."""
+        data = self._location_data.get(self.source)
+        if not data or data.get(self.field) in (None, ""):
+            return None
+        try:
+            return float(data[self.field])
+        except (TypeError, ValueError):
+            return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes."""
+        data = self._location_data.get(self.source) or {}
+        attributes = {key: value for key, value in data.items() if key not in ("value", "temp", "t_min", "t_max", "hum", "precipitation")}
+        attributes["stale"] = self.source in (self.coordinator.data or {}).get("stale", [])
+        if self._location_data.get("address"):
+            attributes["address"] = self._location_data["address"]
+        return attributes
@@ -0,0 +1,81 @@
+from .const import TRANSLATION_FALLBACK_LOCALE
+
+
+def normalize_locale(locale):
+    """Return a locale in lower case with hyphens, e.g. de_LU -> de-lu, or None."""
+    return str(locale).replace("_", "-").casefold() if locale else None
+
+
+def fallback_chain(language, fallback=TRANSLATION_FALLBACK_LOCALE):
+    """Return the locales to try for a language, most specific first, e.g. de-LU -> (de-lu, de, en)."""
+    chain = []
+    parts = normalize_locale(language).split("-") if language else []
+    while parts:
+        chain.append("-".join(parts))
+        parts.pop()
+    if fallback not in chain:
+        chain.append(fallback)
+    return tuple(chain)
+
+
+class Translator:
+    """Resolve keys of the /translations payload in a language, falling back to less specific locales.
+
+    The payload is compiled once into a table per locale, and resolved contents
+    are memoized until the translations or the language change. Keys without
+    any translation resolve to themselves.
+    """
+
+    def __init__(self, language=None):
+        # locale -> {(domain, key): content}
+        self.tables = {}
+        self.language = None
+        self.chain = ()
+        self._resolved = {}
+        self.set_language(language)
+
+    def load(self, translations) -> None:
+        """Compile a /translations payload, forgetting resolved contents."""
+        tables = {}
+        for item in translations or []:
+            entry = (item.get("domain"), item.get("key"))
+            for translation in item.get("translations") or []:
+                locale = normalize_locale(translation.get("locale"))
+                content = translation.get("content")
+                if locale and content:
+                    tables.setdefault(locale, {})[entry] = content
+        self.tables = tables
+        self._resolved = {}
+
+    def set_language(self, language) -> bool:
+        """Translate to another language, returning True if it changed."""
+        if language == self.language and self.chain:
+            return False
+        self.language = language
+        self.chain = fallback_chain(language)
+        self._resolved = {}
+        return True
+
+    def translate(self, key, domain):
+        """Return the content of key in the first locale of the fallback chain having it, or the key itself."""
+        entry = (domain, key)
+        try:
+            return self._resolved[entry]
+        except KeyError:
+            pass
+        content = key
+        for locale in self.chain:
+            table = self.tables.get(locale)
+            if table is not None and entry in table:
+                content = table[entry]
+                break
+        self._resolved[entry] = content
+        return content
+
+    def as_dict(self) -> dict:
+        return {
+            "language": self.language,
+            "fallback_chain": list(self.chain),
+            "locales": sorted(self.tables),
+            "resolved": len(self._resolved),
+        }
@@ -0,0 +1,87 @@
+from collections import deque
+
+from .const import TREND_EMA_ALPHA, TREND_SAMPLES, TREND_STEADY_SLOPE
+
+
+class PollenTrend:
+    """Incremental trend of one pollen type.
+
+    Keeps an exponential moving average of the counts and a least squares
+    slope over the last samples. The sums of the regression are updated when
+    a sample enters or leaves the window, so adding a sample is O(1).
+    """
+
+    __slots__ = ("samples", "ema", "_origin", "_sum_x", "_sum_y", "_sum_xx", "_sum_xy")
+
+    def __init__(self, size=TREND_SAMPLES):
+        self.samples = deque(maxlen=size)
+        self.ema = None
+        self._origin = None
+        self._sum_x = self._sum_y = self._sum_xx = self._sum_xy = 0.0
+
+    def add(self, timestamp, value) -> None:
+        """Add a sample, measured at timestamp (seconds since the epoch)."""
+        if self._origin is None:
+            self._origin = timestamp
+        # Days since the first sample keep the sums small and the slope in counts per day
+        x = (timestamp - self._origin) / 86400
+        if len(self.samples) == self.samples.maxlen:
+            old_x, old_y = self.samples[0]
+            self._update_sums(old_x, old_y, -1)
+        self.samples.append((x, value))
+        self._update_sums(x, value, 1)
+        self.ema = value if self.ema is None else TREND_EMA_ALPHA * value + (1 - TREND_EMA_ALPHA) * self.ema
+
+    def _update_sums(self, x, y, sign) -> None:
+        self._sum_x += sign * x
+        self._sum_y += sign * y
+        self._sum_xx += sign * x * x
+        self._sum_xy += sign * x * y
+
+    @property
+    def slope(self):
+        """Return the least squares slope in counts per day, or None with fewer than two samples."""
+        count = len(self.samples)
+        if count < 2:
+            return None
+        denominator = count * self._sum_xx - self._sum_x * self._sum_x
+        if denominator <= 1e-12:
+            return None
+        return (count * self._sum_xy - self._sum_x * self._sum_y) / denominator
+
+    @property
+    def direction(self):
+        """Return rising, falling or steady, or None without a slope."""
+        slope = self.slope
+        if slope is None:
+            return None
+        if slope > TREND_STEADY_SLOPE:
+            return "rising"
+        if slope < -TREND_STEADY_SLOPE:
+            return "falling"
+        return "steady"
+
+    @property
+    def forecast(self):
+        """Return the count expected at the next measurement, extrapolating the slope by the mean sample spacing."""
+        slope = self.slope
+        if slope is None:
+            return None
+        count = len(self.samples)
+        last_x = self.samples[-1][0]
+        spacing = (last_x - self.samples[0][0]) / (count - 1)
+        intercept = (self._sum_y - slope * self._sum_x) / count
+        return max(0.0, intercept + slope * (last_x + spacing))
+
+    def attributes(self) -> dict:
+        """Return the trend as sensor attributes."""
+        if self.ema is None:
+            return {}
+        slope = self.slope
+        forecast = self.forecast
+        return {
+            "trend": self.direction,
+            "trend_slope": round(slope, 2) if slope is not None else None,
+            "ema": round(self.ema, 2),
+            "forecast": round(forecast) if forecast is not None else None,
+        }